@@ -2,5 +2,20 @@
 
 from auto_fastapi.auto import *
 from auto_fastapi.server import *
+from auto_fastapi.dispatch import *
+from auto_fastapi.cache import *
+from auto_fastapi.flight import *
+from auto_fastapi.executor import *
+from auto_fastapi.lazy import *
+from auto_fastapi.lifespan import *
+from auto_fastapi.profiler import *
+from auto_fastapi.metrics import *
+from auto_fastapi.flyweight import *
+from auto_fastapi.analysis import *
+from auto_fastapi.serialization import *
+from auto_fastapi.streaming import *
+from auto_fastapi.sse import *
+from auto_fastapi.broadcast import *
 from auto_fastapi.base import *
+from auto_fastapi.scheduler import *
 from auto_fastapi.automation import *
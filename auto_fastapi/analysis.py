@@ -0,0 +1,189 @@
+# analysis.py
+
+import threading
+import contextlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Hashable, Generator
+
+import fastapi.routing
+
+from auto_fastapi.flight import freeze
+
+__all__ = [
+    "AnalysisCache",
+    "AnalysisStats",
+    "ANALYSIS"
+]
+
+@dataclass(slots=True)
+class AnalysisStats:
+
+    hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+
+    def data(self) -> dict[str, int]:
+
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            uncacheable=self.uncacheable
+        )
+
+class Identity:
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: ...) -> None:
+
+        self.value = value
+
+    def __hash__(self) -> int:
+
+        return id(self.value)
+
+    def __eq__(self, other: ...) -> bool:
+
+        return isinstance(other, Identity) and (self.value is other.value)
+
+def dependant_key(*, path: str, call: Callable, dependencies: ...) -> Hashable:
+
+    return call, path, tuple(freeze(depends) for depends in dependencies)
+
+def field_key(**kwargs) -> Hashable:
+
+    return freeze(kwargs)
+
+def body_key(*, body_params: list, name: str, embed_body_fields: bool) -> Hashable:
+
+    return tuple(map(Identity, body_params)), name, embed_body_fields
+
+def path_key(path: str) -> Hashable:
+
+    return path
+
+TARGETS: dict[str, Callable[..., Hashable]] = {
+    "_build_dependant_with_parameterless_dependencies": dependant_key,
+    "create_model_field": field_key,
+    "_get_body_field": body_key,
+    "compile_path": path_key
+}
+
+class AnalysisCache:
+
+    def __init__(self, max_entries: int = 10_000, enabled: bool = True) -> None:
+
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self.stats = AnalysisStats()
+
+        self._entries: OrderedDict[Hashable, ...] = OrderedDict()
+        self._patched: dict[str, Callable] = {}
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+
+    def lookup(
+            self,
+            name: str,
+            key: Hashable,
+            c: Callable,
+            args: tuple,
+            kwargs: dict[str, ...]
+    ) -> ...:
+
+        key = (name, key)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+                self.stats.hits += 1
+
+                return self._entries[key]
+
+        value = c(*args, **kwargs)
+
+        with self._lock:
+            self.stats.misses += 1
+
+            self._entries[key] = value
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def wrap(self, name: str, c: Callable, key: Callable[..., Hashable]) -> Callable:
+
+        @wraps(c)
+        def cached(*args, **kwargs) -> ...:
+
+            try:
+                k = key(*args, **kwargs)
+                hash(k)
+
+            except TypeError:
+                self.stats.uncacheable += 1
+
+                return c(*args, **kwargs)
+
+            return self.lookup(name, k, c, args, kwargs)
+
+        return cached
+
+    def patch(self) -> None:
+
+        for name, key in TARGETS.items():
+            original = getattr(fastapi.routing, name, None)
+
+            if original is None:
+                continue
+
+            self._patched[name] = original
+
+            setattr(fastapi.routing, name, self.wrap(name, original, key))
+
+    def unpatch(self) -> None:
+
+        for name, original in self._patched.items():
+            setattr(fastapi.routing, name, original)
+
+        self._patched.clear()
+
+    @contextlib.contextmanager
+    def activate(self) -> Generator[None, None, None]:
+
+        if not self.enabled:
+            yield
+
+            return
+
+        with self._lock:
+            if not self._depth:
+                self.patch()
+
+            self._depth += 1
+
+        try:
+            yield
+
+        finally:
+            with self._lock:
+                self._depth -= 1
+
+                if not self._depth:
+                    self.unpatch()
+
+ANALYSIS = AnalysisCache()
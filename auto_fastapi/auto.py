@@ -1,16 +1,33 @@
 # auto.py
 
+import copy
+import contextlib
 from abc import ABCMeta
 from enum import Enum
-from dataclasses import dataclass
-from typing import Sequence, Callable, overload, Iterable, Self, TypeVar
+from dataclasses import dataclass, field
+from typing import Sequence, Callable, overload, Iterable, Self, TypeVar, Generator
 
-from fastapi import Response, Depends, FastAPI
+import fastapi.openapi.utils
+from fastapi import Response, Depends, FastAPI, APIRouter
 from fastapi.responses import JSONResponse
-from fastapi.datastructures import Default
+from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.utils import generate_unique_id
 from fastapi.routing import APIRoute, BaseRoute
 
+from auto_fastapi.dispatch import Dispatcher, dispatch
+from auto_fastapi.cache import ResponseCache, build_cache
+from auto_fastapi.flight import SingleFlight, build_single_flight
+from auto_fastapi.executor import Executor, build_executor
+from auto_fastapi.lazy import LazyCallable, build_lazy
+from auto_fastapi.profiler import profiled, first
+from auto_fastapi.metrics import Metrics, build_metrics
+from auto_fastapi.flyweight import intern, override
+from auto_fastapi.analysis import ANALYSIS
+from auto_fastapi.serialization import Serializer, build_serializer
+from auto_fastapi.streaming import Stream, StreamResponse, build_streamer
+from auto_fastapi.sse import EventSource, EventStreamResponse, build_event_source
+from auto_fastapi.broadcast import BroadcastHub, build_hub
+
 __all__ = [
     "BaseEndpoint",
     "Endpoint",
@@ -57,7 +74,15 @@ __all__ = [
     "bind_all",
     "Builder",
     "push",
-    "push_all"
+    "push_all",
+    "remove",
+    "replace",
+    "swap_routes",
+    "batch",
+    "AddedIndex",
+    "get_built",
+    "build_stream",
+    "build_sse"
 ]
 
 IncEx = set[int] | set[str] | dict[int, ...] | dict[str, ...]
@@ -80,12 +105,13 @@ METHODS = (
     Method.TRACE
 )
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class WebSocketEndpoint:
 
     path: str
     name: str = None
     dependencies: Sequence[Depends] = None
+    hub: BroadcastHub = None
 
     def data(self) -> dict[str, ...]:
 
@@ -97,7 +123,7 @@ class WebSocketEndpoint:
 
     def clone(self) -> Self:
 
-        return WebSocketEndpoint(**self.data())
+        return self
 
     def bind(self, c: Callable) -> "BoundWebSocketEndpoint":
 
@@ -124,8 +150,9 @@ class AddedWebSocketEndpoint:
 
     bound: BoundWebSocketEndpoint
     added: Callable
+    routes: list[BaseRoute] = field(default_factory=list)
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class Event:
 
     event_type: str
@@ -136,7 +163,7 @@ class Event:
 
     def clone(self) -> Self:
 
-        return Event(**self.data())
+        return self
 
     def bind(self, c: Callable) -> "BoundEvent":
 
@@ -162,7 +189,7 @@ class AddedEvent:
     bound: BoundEvent
     added: Callable
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class Middleware:
 
     middleware_type: str
@@ -173,7 +200,7 @@ class Middleware:
 
     def clone(self) -> Self:
 
-        return Middleware(**self.data())
+        return self
 
     def bind(self, c: Callable) -> "BoundMiddleware":
 
@@ -201,7 +228,7 @@ class AddedMiddleware:
     bound: BoundMiddleware
     added: Callable
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class ExceptionHandler:
 
     exc_class_or_status_code: int | type[Exception]
@@ -212,7 +239,7 @@ class ExceptionHandler:
 
     def clone(self) -> Self:
 
-        return ExceptionHandler(**self.data())
+        return self
 
 @dataclass(slots=True)
 class BoundExceptionHandler:
@@ -236,7 +263,7 @@ class AddedExceptionHandler:
     bound: BoundExceptionHandler
     added: Callable
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class BaseEndpoint:
 
     path: str
@@ -263,6 +290,12 @@ class BaseEndpoint:
     callbacks: list[BaseRoute] = None
     openapi_extra: dict[str, ...] = None
     generate_unique_id_function: Callable[[APIRoute], str] = None
+    cache: ResponseCache = None
+    coalesce: SingleFlight = None
+    executor: Executor = None
+    serializer: Serializer = None
+    stream: Stream = None
+    sse: EventSource = None
 
     def data(self) -> dict[str, ...]:
 
@@ -292,25 +325,62 @@ class BaseEndpoint:
             generate_unique_id_function=self.generate_unique_id_function
         )
 
-@dataclass(slots=True)
+    def options(self) -> dict[str, ...]:
+
+        return dict(
+            cache=self.cache,
+            coalesce=self.coalesce,
+            executor=self.executor,
+            serializer=self.serializer,
+            stream=self.stream,
+            sse=self.sse
+        )
+
+    def override(self, **changes) -> Self:
+
+        return override(self, **changes)
+
+@dataclass(slots=True, frozen=True)
 class Endpoint(BaseEndpoint):
 
     c: Callable = None
 
     def clone(self) -> Self:
 
-        return Endpoint(c=self.c, **self.data())
+        return self
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class EndpointBuilder(BaseEndpoint):
 
+    _endpoints: dict[Callable, Endpoint] = field(
+        init=False, default_factory=dict, compare=False, repr=False
+    )
+
+    @profiled("build", lambda self, c: (c, self))
     def build(self, c: Callable) -> Endpoint:
 
-        return Endpoint(c=c, methods=self.methods, **self.data())
+        try:
+            endpoint = self._endpoints.get(c)
+
+        except TypeError:
+            endpoint = None
+
+        if endpoint is None:
+            endpoint = Endpoint(
+                c=c, methods=self.methods, **self.data(), **self.options()
+            )
+
+            try:
+                self._endpoints[c] = endpoint
+
+            except TypeError:
+                pass
+
+        return endpoint
 
     def clone(self) -> Self:
 
-        return EndpointBuilder(methods=self.methods, **self.data())
+        return self
 
 @dataclass(slots=True)
 class BoundEndpoint:
@@ -328,42 +398,53 @@ class BoundEndpoint:
         return BoundEndpoint(
             c=self.c,
             builder=self.builder,
-            endpoints=self.endpoints
+            endpoints=self.endpoints.copy()
         )
 
+    def override(self, **changes) -> Self:
+
+        return bind_endpoint(self.c, self.builder.override(**changes))
+
 @dataclass(slots=True)
 class AddedEndpoint:
 
     bound: BoundEndpoint
     added: dict[Method, Callable]
+    routes: list[BaseRoute] = field(default_factory=list)
 
 def build_websocket_endpoint(
         path: str,
         name: str = None,
-        dependencies: Sequence[Depends] = None
+        dependencies: Sequence[Depends] = None,
+        hub: BroadcastHub = None
 ) -> WebSocketEndpoint:
 
-    return WebSocketEndpoint(
-        path=path,
-        name=name,
-        dependencies=dependencies
+    return intern(
+        WebSocketEndpoint(
+            path=path,
+            name=name,
+            dependencies=dependencies,
+            hub=hub
+        )
     )
 
 def build_exception_handler(
         exc_class_or_status_code: int | type[Exception]
 ) -> ExceptionHandler:
 
-    return ExceptionHandler(
-        exc_class_or_status_code=exc_class_or_status_code
+    return intern(
+        ExceptionHandler(
+            exc_class_or_status_code=exc_class_or_status_code
+        )
     )
 
 def build_middleware(middleware_type: str) -> Middleware:
 
-    return Middleware(middleware_type=middleware_type)
+    return intern(Middleware(middleware_type=middleware_type))
 
 def build_event(event_type: str) -> Event:
 
-    return Event(event_type=event_type)
+    return intern(Event(event_type=event_type))
 
 def build_endpoint(
         path: str,
@@ -389,45 +470,113 @@ def build_endpoint(
         name: str = None,
         callbacks: list[BaseRoute] = None,
         openapi_extra: dict[str, ...] = None,
-        generate_unique_id_function: Callable[[APIRoute], str] = Default(generate_unique_id)
+        generate_unique_id_function: Callable[[APIRoute], str] = Default(generate_unique_id),
+        cache: ResponseCache = None,
+        coalesce: SingleFlight = None,
+        executor: Executor = None,
+        serializer: Serializer = None,
+        stream: Stream = None,
+        sse: EventSource = None
+) -> EndpointBuilder:
+
+    return intern(
+        EndpointBuilder(
+            path=path,
+            methods=tuple(dict.fromkeys(methods)),
+            response_model=response_model,
+            status_code=status_code,
+            tags=tags,
+            dependencies=dependencies,
+            summary=summary,
+            description=description,
+            response_description=response_description,
+            responses=responses,
+            deprecated=deprecated,
+            operation_id=operation_id,
+            response_model_include=response_model_include,
+            response_model_exclude=response_model_exclude,
+            response_model_by_alias=response_model_by_alias,
+            response_model_exclude_unset=response_model_exclude_unset,
+            response_model_exclude_defaults=response_model_exclude_defaults,
+            response_model_exclude_none=response_model_exclude_none,
+            include_in_schema=include_in_schema,
+            response_class=response_class,
+            name=name,
+            callbacks=callbacks,
+            openapi_extra=openapi_extra,
+            generate_unique_id_function=generate_unique_id_function,
+            cache=cache,
+            coalesce=coalesce,
+            executor=executor,
+            serializer=serializer,
+            stream=stream,
+            sse=sse
+        )
+    )
+
+def build_stream(
+        path: str,
+        methods: Iterable[Method] = (Method.GET,),
+        framing: str = "ndjson",
+        batch: int = 256,
+        media_type: str = None,
+        columns: Iterable[str] = None,
+        header: bool = True,
+        **options
 ) -> EndpointBuilder:
 
-    return EndpointBuilder(
+    options.setdefault("response_model", None)
+    options.setdefault("response_class", StreamResponse)
+
+    return build_endpoint(
+        path=path,
+        methods=methods,
+        stream=build_streamer(
+            framing=framing,
+            batch=batch,
+            media_type=media_type,
+            columns=columns,
+            header=header
+        ),
+        **options
+    )
+
+def build_sse(
+        path: str,
+        methods: Iterable[Method] = (Method.GET,),
+        buffer: int = 256,
+        policy: str = "drop_oldest",
+        heartbeat: float = 15.0,
+        retry: int = None,
+        **options
+) -> EndpointBuilder:
+
+    options.setdefault("response_model", None)
+    options.setdefault("response_class", EventStreamResponse)
+
+    return build_endpoint(
         path=path,
         methods=methods,
-        response_model=response_model,
-        status_code=status_code,
-        tags=tags,
-        dependencies=dependencies,
-        summary=summary,
-        description=description,
-        response_description=response_description,
-        responses=responses,
-        deprecated=deprecated,
-        operation_id=operation_id,
-        response_model_include=response_model_include,
-        response_model_exclude=response_model_exclude,
-        response_model_by_alias=response_model_by_alias,
-        response_model_exclude_unset=response_model_exclude_unset,
-        response_model_exclude_defaults=response_model_exclude_defaults,
-        response_model_exclude_none=response_model_exclude_none,
-        include_in_schema=include_in_schema,
-        response_class=response_class,
-        name=name,
-        callbacks=callbacks,
-        openapi_extra=openapi_extra,
-        generate_unique_id_function=generate_unique_id_function
+        sse=build_event_source(
+            buffer=buffer,
+            policy=policy,
+            heartbeat=heartbeat,
+            retry=retry
+        ),
+        **options
     )
 
 def bind_endpoint(c: Callable, builder: EndpointBuilder) -> BoundEndpoint:
 
+    endpoint = builder.build(c)
+
+    if builder.serializer is not None:
+        builder.serializer.compile(builder.response_model, c)
+
     return BoundEndpoint(
         c=c,
         builder=builder,
-        endpoints={
-            method: builder.build(c)
-            for method in set(builder.methods)
-        }
+        endpoints=dict.fromkeys(builder.methods, endpoint)
     )
 
 def bind_event(c: Callable, event: Event) -> BoundEvent:
@@ -503,8 +652,16 @@ BOUND = [
     BoundMiddleware
 ]
 
+@profiled("bind", lambda c, *args, **kwargs: (c, first(args, kwargs)))
 def bind(c: Callable, *args, **kwargs) -> Bound:
 
+    if isinstance(c, str):
+        raise TypeError(
+            f"{bind} cannot bind the bare reference '{c}' since it declares "
+            f"no signature, use Builder.lazy('{c}', signature) to declare "
+            f"the parameters of the referenced callable."
+        )
+
     if (
         (not args and not kwargs) or
         (args and kwargs) or
@@ -579,30 +736,165 @@ def bind(c: Callable, *args, **kwargs) -> Bound:
 Built = WebSocketEndpoint | EndpointBuilder | Middleware | ExceptionHandler | Event
 BUILT = [WebSocketEndpoint, EndpointBuilder, Middleware, ExceptionHandler, Event]
 
+def get_built(bound: Bound) -> Built:
+
+    if isinstance(bound, BoundEndpoint):
+        return bound.builder
+
+    if isinstance(bound, BoundWebSocketEndpoint):
+        return bound.endpoint
+
+    if isinstance(bound, BoundEvent):
+        return bound.event
+
+    if isinstance(bound, BoundMiddleware):
+        return bound.middleware
+
+    if isinstance(bound, BoundExceptionHandler):
+        return bound.handler
+
+    raise TypeError(f"bound must be one of {', '.join(map(str, BOUND))}, got: {bound}")
+
 def bind_all(data: Iterable[tuple[Callable, Built]]) -> list[Bound]:
 
     return [bind(c, built) for c, built in data]
 
-App = FastAPI | APIRoute
+App = FastAPI | APIRouter
+
+def app_router(app: App) -> APIRouter:
+
+    return app.router if isinstance(app, FastAPI) else app
+
+def unwrap_default(value: ...) -> ...:
+
+    return value.value if isinstance(value, DefaultPlaceholder) else value
+
+class MethodOperation:
+
+    def __init__(self, route: ..., method: str) -> None:
+
+        self.route = route
+        self.methods = {method}
+
+    def __getattr__(self, name: str) -> ...:
+
+        return getattr(self.route, name)
+
+    @property
+    def unique_id(self) -> str:
+
+        return unwrap_default(self.route.generate_unique_id_function)(self)
+
+def operations() -> None:
+
+    metadata = fastapi.openapi.utils.get_openapi_operation_metadata
+
+    if metadata.__name__ == "method_operation_metadata":
+        return
+
+    def method_operation_metadata(*, route: ..., method: str, **kwargs) -> dict[str, ...]:
+
+        if getattr(getattr(route, "original_route", route), "per_method", False):
+            route = MethodOperation(route, method)
+
+        return metadata(route=route, method=method, **kwargs)
+
+    fastapi.openapi.utils.get_openapi_operation_metadata = method_operation_metadata
 
 def add_endpoint(app: App, endpoint: BoundEndpoint) -> AddedEndpoint:
 
+    methods = [
+        method for method in endpoint.endpoints
+        if hasattr(app, method.value.lower())
+    ]
+
+    router = app_router(app)
+
+    c = endpoint.c
+
+    if endpoint.builder.stream is not None:
+        c = endpoint.builder.stream.wrap(c, status_code=endpoint.builder.status_code)
+
+    if endpoint.builder.sse is not None:
+        c = endpoint.builder.sse.wrap(c, status_code=endpoint.builder.status_code)
+
+    if endpoint.builder.executor is not None:
+        c = endpoint.builder.executor.wrap(c)
+
+    if endpoint.builder.coalesce is not None:
+        c = endpoint.builder.coalesce.wrap(c)
+
+    if endpoint.builder.serializer is not None:
+        builder = endpoint.builder
+
+        c = builder.serializer.wrap(
+            c,
+            response_model=builder.response_model,
+            status_code=builder.status_code,
+            include=builder.response_model_include,
+            exclude=builder.response_model_exclude,
+            by_alias=builder.response_model_by_alias,
+            exclude_unset=builder.response_model_exclude_unset,
+            exclude_defaults=builder.response_model_exclude_defaults,
+            exclude_none=builder.response_model_exclude_none
+        )
+
+    options = {}
+
+    if endpoint.builder.cache is not None:
+        options["route_class_override"] = (
+            endpoint.builder.cache.route_class(router.route_class)
+        )
+
+    start = len(router.routes)
+
+    data = endpoint.data()
+
+    if (endpoint.builder.serializer is not None) and (
+        unwrap_default(data["response_class"]) is JSONResponse
+    ):
+        data["response_class"] = endpoint.builder.serializer.response_class()
+
+    if methods:
+        with ANALYSIS.activate():
+            router.add_api_route(
+                endpoint=c,
+                methods=[method.value for method in methods],
+                **data,
+                **options
+            )
+
+        if len(methods) > 1:
+            operations()
+
+            router.routes[-1].per_method = True
+
     return AddedEndpoint(
         bound=endpoint,
-        added={
-            method: getattr(app, method.value.lower())(**endpoint.data())(endpoint.c)
-            for method, method_endpoint in endpoint.endpoints.items()
-            if hasattr(app, method.value.lower())
-        }
+        added={method: endpoint.c for method in methods},
+        routes=router.routes[start:]
     )
 
 def add_websocket_endpoint(
         app: App, endpoint: BoundWebSocketEndpoint
 ) -> AddedWebSocketEndpoint:
 
+    router = app_router(app)
+
+    c = endpoint.c
+
+    if endpoint.endpoint.hub is not None:
+        c = endpoint.endpoint.hub.wrap(c)
+
+    start = len(router.routes)
+
+    with ANALYSIS.activate():
+        added = app.websocket(**endpoint.data())(c)
+
     return AddedWebSocketEndpoint(
         bound=endpoint,
-        added=app.websocket(**endpoint.data())(endpoint.c)
+        added=added,
+        routes=router.routes[start:]
     )
 
 def add_middleware(app: App, middleware: BoundMiddleware) -> AddedMiddleware:
@@ -664,6 +956,12 @@ ADDED = [
     AddedExceptionHandler
 ]
 
+@profiled(
+    "add",
+    lambda app, *args, **kwargs: (
+        getattr(first(args, kwargs), "c", None), first(args, kwargs)
+    )
+)
 def add(app: App, *args, **kwargs) -> Added:
 
     if (
@@ -740,9 +1038,14 @@ def add(app: App, *args, **kwargs) -> Added:
                 f"got: {type(args[0])}"
             )
 
+def routed(bound: Bound) -> bool:
+
+    return isinstance(bound, (BoundEndpoint, BoundWebSocketEndpoint))
+
 def add_all(app: App, bound: Iterable[Bound]) -> list[Added]:
 
-    return [add(app, b) for b in bound]
+    with batch(app) as staging:
+        return [add(staging if routed(b) else app, b) for b in bound]
 
 def push(app: App, c: Callable, built: Built) -> Added:
 
@@ -750,7 +1053,104 @@ def push(app: App, c: Callable, built: Built) -> Added:
 
 def push_all(app: App, data: Iterable[tuple[Callable, Built]]) -> list[Added]:
 
-    return [push(app, *d) for d in data]
+    return add_all(app, (bind(c, built) for c, built in data))
+
+def swap_routes(
+        app: App,
+        old: Iterable[BaseRoute],
+        new: Iterable[BaseRoute] = ()
+) -> None:
+
+    router = app_router(app)
+
+    new = list(new)
+
+    removed = {id(route) for route in old}
+    inserted = {id(route) for route in new}
+
+    routes = []
+
+    for route in router.routes:
+        if id(route) in inserted:
+            continue
+
+        if id(route) in removed:
+            routes.extend(new)
+
+            new = []
+
+            continue
+
+        routes.append(route)
+
+    routes.extend(new)
+
+    router.routes = routes
+
+    changed(app)
+
+def changed(app: App) -> None:
+
+    mark = getattr(app_router(app), "_mark_routes_changed", None)
+
+    if mark is not None:
+        mark()
+
+    if isinstance(app, FastAPI):
+        app.openapi_schema = None
+
+@contextlib.contextmanager
+def batch(app: App) -> Generator[APIRouter, None, None]:
+
+    router = app_router(app)
+
+    staging = copy.copy(router)
+    staging.routes = []
+
+    yield staging
+
+    if staging.routes:
+        router.routes.extend(staging.routes)
+
+        changed(app)
+
+def remove(
+        app: App, added: AddedEndpoint | AddedWebSocketEndpoint
+) -> AddedEndpoint | AddedWebSocketEndpoint:
+
+    if not isinstance(added, (AddedEndpoint, AddedWebSocketEndpoint)):
+        raise TypeError(
+            f"{remove} can only remove objects of types "
+            f"{AddedEndpoint} or {AddedWebSocketEndpoint}, got: {type(added)}"
+        )
+
+    swap_routes(app, added.routes)
+
+    return added
+
+def replace(
+        app: App,
+        added: AddedEndpoint | AddedWebSocketEndpoint,
+        bound: BoundEndpoint | BoundWebSocketEndpoint
+) -> AddedEndpoint | AddedWebSocketEndpoint:
+
+    if not isinstance(added, (AddedEndpoint, AddedWebSocketEndpoint)):
+        raise TypeError(
+            f"{replace} can only replace objects of types "
+            f"{AddedEndpoint} or {AddedWebSocketEndpoint}, got: {type(added)}"
+        )
+
+    if not isinstance(bound, (BoundEndpoint, BoundWebSocketEndpoint)):
+        raise TypeError(
+            f"{replace} can only replace with objects of types "
+            f"{BoundEndpoint} or {BoundWebSocketEndpoint}, got: {type(bound)}"
+        )
+
+    new = add(app, bound)
+
+    swap_routes(app, added.routes, new.routes)
+
+    return new
 
 _B = TypeVar("_B", Bound, Built)
 
@@ -769,6 +1169,128 @@ class Builder(metaclass=ABCMeta):
     endpoint = build_endpoint
     middleware = build_middleware
     event = build_event
+    cache = build_cache
+    single_flight = build_single_flight
+    executor = build_executor
+    lazy = build_lazy
+    metrics = build_metrics
+    serializer = build_serializer
+    stream = build_stream
+    sse = build_sse
+    hub = build_hub
+
+WEBSOCKET = "WEBSOCKET"
+
+def method_key(method: Method | str) -> str:
+
+    return method.value if isinstance(method, Method) else method.upper()
+
+def callable_key(c: Callable | str) -> int | str:
+
+    if isinstance(c, str):
+        return c
+
+    if isinstance(c, LazyCallable):
+        return c.reference
+
+    return id(c)
+
+@dataclass(slots=True)
+class AddedIndex:
+
+    identities: dict[int, Added] = field(default_factory=dict)
+    routes: dict[tuple[str, str], Added] = field(default_factory=dict)
+    callables: dict[int | str, dict[int, Added]] = field(default_factory=dict)
+    tags: dict[str | Enum, dict[int, Added]] = field(default_factory=dict)
+    types: dict[type[Built], dict[int, Added]] = field(default_factory=dict)
+
+    @staticmethod
+    def keys(added: Added) -> list[tuple[str, str]]:
+
+        bound = added.bound
+
+        if isinstance(bound, BoundEndpoint):
+            return [
+                (bound.builder.path, method_key(method))
+                for method in bound.endpoints
+            ]
+
+        if isinstance(bound, BoundWebSocketEndpoint):
+            return [(bound.endpoint.path, WEBSOCKET)]
+
+        return []
+
+    @staticmethod
+    def labels(added: Added) -> list[str | Enum]:
+
+        if isinstance(added.bound, BoundEndpoint):
+            return list(added.bound.builder.tags or [])
+
+        return []
+
+    def groups(self, added: Added) -> list[dict[int, Added]]:
+
+        return [
+            self.callables.setdefault(callable_key(added.bound.c), {}),
+            self.types.setdefault(type(get_built(added.bound)), {}),
+            *(self.tags.setdefault(tag, {}) for tag in self.labels(added))
+        ]
+
+    def insert(self, added: Added) -> None:
+
+        self.identities[id(added)] = added
+        self.identities[id(added.bound)] = added
+
+        for key in self.keys(added):
+            self.routes[key] = added
+
+        for group in self.groups(added):
+            group[id(added)] = added
+
+    def delete(self, added: Added) -> None:
+
+        for identity in (id(added), id(added.bound)):
+            if self.identities.get(identity) is added:
+                self.identities.pop(identity)
+
+        for key in self.keys(added):
+            if self.routes.get(key) is added:
+                self.routes.pop(key)
+
+        for index, key in (
+            (self.callables, callable_key(added.bound.c)),
+            (self.types, type(get_built(added.bound))),
+            *((self.tags, tag) for tag in self.labels(added))
+        ):
+            group = index.get(key)
+
+            if group is None:
+                continue
+
+            group.pop(id(added), None)
+
+            if not group:
+                index.pop(key)
+
+    def get(self, bound: Bound | Added) -> Added | None:
+
+        return self.identities.get(id(bound))
+
+    def by_route(self, path: str, method: Method | str) -> Added | None:
+
+        return self.routes.get((path, method_key(method)))
+
+    def by_callable(self, c: Callable | str) -> list[Added]:
+
+        return list(self.callables.get(callable_key(c), {}).values())
+
+    def by_tag(self, tag: str | Enum) -> list[Added]:
+
+        return list(self.tags.get(tag, {}).values())
+
+    def by_type(self, kind: type[Built]) -> list[Added]:
+
+        return list(self.types.get(kind, {}).values())
 
 class AutoFastAPI:
 
@@ -777,7 +1299,9 @@ class AutoFastAPI:
             app: App = None,
             bound: Iterable[Bound] = None,
             added: Iterable[Added] = None,
-            added_bound: Iterable[Bound] = None
+            added_bound: Iterable[Bound] = None,
+            dispatch: bool = False,
+            metrics: Metrics = None
     ) -> None:
 
         if added_bound is None:
@@ -793,6 +1317,15 @@ class AutoFastAPI:
         self.bound = bound
         self.added_bound = added_bound
         self.added = added
+        self.dispatch = dispatch
+        self.metrics = metrics
+
+        self.dispatcher: Dispatcher | None = None
+
+        self.index = AddedIndex()
+
+        for a in self.added:
+            self.index.insert(a)
 
         self.build = Builder
 
@@ -801,7 +1334,9 @@ class AutoFastAPI:
         return AutoFastAPI(
             app=self.app,
             bound=clone_all(self.bound),
-            added=self.added.copy()
+            added=self.added.copy(),
+            dispatch=self.dispatch,
+            metrics=self.metrics
         )
 
     def bind(self, c, built: Built) -> Bound:
@@ -832,31 +1367,174 @@ class AutoFastAPI:
 
     def add(self, app: App = None, bound: Bound = None) -> Added:
 
-        if (app, self.app) == (None, None):
-            raise ValueError("App is not given nor defined.")
+        if bound is None:
+            app, bound = None, app
+
+        app = self.target(app)
 
         if bound is None:
             raise TypeError("bound must be given.")
 
+        added = add(app, bound)
+
+        self.register(app, bound, added)
+
+        return added
+
+    def target(self, app: App = None) -> App:
+
+        if app is None:
+            app = self.app
+
+        if app is None:
+            raise ValueError("App is not given nor defined.")
+
         self.app = app
 
-        added = add(app, bound)
+        return app
+
+    def register(self, app: App, bound: Bound, added: Added) -> None:
+
+        if self.dispatch and isinstance(
+            bound, (BoundEndpoint, BoundWebSocketEndpoint)
+        ):
+            self.dispatcher = dispatch(app)
+
+        if isinstance(bound, BoundEndpoint) and (bound.builder.executor is not None):
+            bound.builder.executor.attach(app)
+
+        if isinstance(bound.c, LazyCallable):
+            bound.c.attach(app)
+
+        if (self.metrics is not None) and isinstance(added, AddedEndpoint):
+            self.metrics.instrument_all(added.routes)
+            self.metrics.attach(app)
 
         self.added.append(added)
+        self.added_bound.append(bound)
+
+        self.index.insert(added)
+
+    def unregister(self, added: Iterable[Added]) -> None:
+
+        added = list(added)
+
+        identities = {id(a) for a in added}
+        bounds = {id(a.bound) for a in added}
+
+        for a in added:
+            self.index.delete(a)
+
+        self.added[:] = [a for a in self.added if id(a) not in identities]
+        self.added_bound[:] = [b for b in self.added_bound if id(b) not in bounds]
+
+    def find(self, bound: Bound | Added) -> Added:
+
+        added = self.index.get(bound)
+
+        if added is None:
+            raise ValueError(f"{bound} was not added by {self}.")
+
+        return added
+
+    def find_route(self, path: str, method: Method | str) -> Added | None:
+
+        return self.index.by_route(path, method)
+
+    def find_callable(self, c: Callable | str) -> list[Added]:
+
+        return self.index.by_callable(c)
+
+    def find_tag(self, tag: str | Enum) -> list[Added]:
+
+        return self.index.by_tag(tag)
+
+    def find_type(self, kind: type[Built]) -> list[Added]:
+
+        return self.index.by_type(kind)
+
+    def discard(self, added: Added) -> None:
+
+        self.index.delete(added)
+
+        self.added[:] = [a for a in self.added if a is not added]
+        self.added_bound[:] = [b for b in self.added_bound if b is not added.bound]
+
+    def remove(self, bound: Bound | Added, app: App = None) -> Added:
+
+        if app is None:
+            app = self.app
+
+        if app is None:
+            raise ValueError("App is not given nor defined.")
+
+        added = self.find(bound)
+
+        remove(app, added)
+
+        self.discard(added)
 
         return added
 
-    def add_all(self, app: App = None) -> list[Added]:
+    def replace(
+            self,
+            bound: Bound | Added,
+            new: BoundEndpoint | BoundWebSocketEndpoint,
+            app: App = None
+    ) -> Added:
+
+        if app is None:
+            app = self.app
+
+        if app is None:
+            raise ValueError("App is not given nor defined.")
+
+        added = self.find(bound)
+
+        if not isinstance(added, (AddedEndpoint, AddedWebSocketEndpoint)):
+            raise TypeError(
+                f"{self.replace} can only replace endpoints, got: {type(added)}"
+            )
+
+        replacement = self.add(app, new)
+
+        swap_routes(app, added.routes, replacement.routes)
+
+        self.discard(added)
+
+        return replacement
+
+    def add_all(self, app: App = None, bound: Iterable[Bound] = None) -> list[Added]:
+
+        app = self.target(app)
+
+        pending = bound is None
+
+        if pending:
+            bound = self.bound.copy()
 
         added = []
+        staged = []
+
+        try:
+            with batch(app) as staging:
+                for b in bound:
+                    a = add(staging if routed(b) else app, b)
+
+                    self.register(app, b, a)
+
+                    added.append(a)
 
-        for bound in self.bound.copy():
-            a = self.add(app, bound)
+        except BaseException:
+            staged = [a for a in added if routed(a.bound)]
 
-            added.append(a)
-            self.added.append(a)
-            self.bound.remove(bound)
-            self.added_bound.append(bound)
+            self.unregister(staged)
+
+            raise
+
+        finally:
+            if pending:
+                self.bound[:len(added)] = [a.bound for a in staged]
 
         return added
 
@@ -876,17 +1554,13 @@ class AutoFastAPI:
             data: tuple[Callable, Built] = None
     ) -> Added:
 
-        if (app, self.app) == (None, None):
-            raise ValueError("App is not given nor defined.")
-
         if data is None:
-            data = app
-            app = self.app
+            app, data = None, app
 
         if data is None:
-            raise TypeError("bound must be given.")
+            raise TypeError("data must be given.")
 
-        return self.add(app, self.bind(*data))
+        return self.add(app, bind(*data))
 
     @overload
     def push_all(
@@ -911,4 +1585,7 @@ class AutoFastAPI:
             data: Iterable[tuple[Callable, Built]] = None
     ) -> list[Added]:
 
-        return [self.add(app, self.bind(c, built)) for c, built in data]
+        if data is None:
+            app, data = None, app
+
+        return self.add_all(app, (bind(c, built) for c, built in data))
@@ -1,6 +1,5 @@
 # automation.py
 
-import asyncio
 from dataclasses import dataclass, field
 from typing import Callable, Awaitable
 from functools import partial
@@ -8,6 +7,7 @@ from functools import partial
 from dataplace import Callback
 
 from auto_fastapi.base import EndpointsRouter
+from auto_fastapi.scheduler import Scheduler, Schedule
 
 __all__ = [
     "Automation"
@@ -23,6 +23,10 @@ class Automation:
 
     callback: Callback = field(init=False, default=None)
     automations: list["Automation"] = field(default_factory=list)
+    inputs: ... = None
+
+    fingerprint: ... = field(init=False, default=None, repr=False, compare=False)
+    result: ... = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
 
@@ -63,23 +67,39 @@ class Automation:
         self.running = False
         self.complete = True
 
-    async def async_automate(self, router: EndpointsRouter) -> None:
+    async def async_automate(
+            self,
+            router: EndpointsRouter,
+            scheduler: Scheduler = None
+    ) -> Schedule:
 
-        if self.complete:
-            return
+        if scheduler is not None:
+            return await scheduler.run(self, router)
 
-        self.running = True
-        self.complete = False
+        with Scheduler() as scheduler:
+            return await scheduler.run(self, router)
 
-        await asyncio.gather(
-            automation.async_automate(router)
-            for automation in self.automations
-        )
+    def schedule(self, router: EndpointsRouter, workers: int = None) -> Schedule:
 
-        await self.callback.async_call(router)
+        with Scheduler(workers=workers) as scheduler:
+            return scheduler.automate(self, router)
 
-        self.running = False
-        self.complete = True
+    def rebuild(self, router: EndpointsRouter, workers: int = None) -> Schedule:
+
+        with Scheduler(workers=workers) as scheduler:
+            return scheduler.automate(self, router, incremental=True)
+
+    async def async_rebuild(
+            self,
+            router: EndpointsRouter,
+            scheduler: Scheduler = None
+    ) -> Schedule:
+
+        if scheduler is not None:
+            return await scheduler.run(self, router, incremental=True)
+
+        with Scheduler() as scheduler:
+            return await scheduler.run(self, router, incremental=True)
 
     def copy(
             self,
@@ -99,12 +119,19 @@ class Automation:
                 for automation in automations
             ]
 
-        return Automation(
+        automation = Automation(
             operation=self.operation,
             automations=automations,
-            complete=self.complete if complete is None else complete
+            complete=self.complete if complete is None else complete,
+            inputs=self.inputs
         )
 
+        if automation.complete:
+            automation.fingerprint = self.fingerprint
+            automation.result = self.result
+
+        return automation
+
     def clear(self) -> None:
 
         self.complete = False
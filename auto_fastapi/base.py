@@ -1,19 +1,67 @@
 # base.py
 
+import time
+import logging
+import operator
+import asyncio
+import threading
 from dataclasses import dataclass, field
 from abc import ABCMeta
+from typing import Generator, Callable, Iterable
 
 from fastapi import FastAPI, APIRouter
+from fastapi.datastructures import Default
+from fastapi.responses import JSONResponse
+from fastapi.utils import generate_unique_id, get_value_or_default
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import BaseRoute, Match, NoMatchFound, get_route_path
+from starlette.types import Scope, Receive, Send
+
+from auto_fastapi.auto import app_router, changed
+from auto_fastapi.analysis import ANALYSIS
+from auto_fastapi.lazy import resolve
+from auto_fastapi.lifespan import extend_lifespan
 
 __all__ = [
     "BaseEndpoints",
-    "EndpointsRouter"
+    "EndpointsRouter",
+    "LazyMount"
 ]
 
+logger = logging.getLogger(__name__)
+
+Factory = Callable[[], "EndpointsRouter | FastAPI | APIRouter"] | str
+
 class BaseEndpoints(metaclass=ABCMeta):
 
     pass
 
+def context(router: APIRouter, parent: dict[str, ...] = None) -> dict[str, ...]:
+
+    parent = parent or {}
+
+    return dict(
+        prefix=parent.get("prefix", "") + router.prefix,
+        tags=[*parent.get("tags", ()), *(router.tags or ())],
+        dependencies=[
+            *parent.get("dependencies", ()), *(router.dependencies or ())
+        ],
+        responses={**parent.get("responses", {}), **(router.responses or {})},
+        deprecated=parent.get("deprecated") or router.deprecated,
+        include_in_schema=(
+            parent.get("include_in_schema", True) and router.include_in_schema
+        ),
+        default_response_class=get_value_or_default(
+            router.default_response_class,
+            parent.get("default_response_class", Default(JSONResponse))
+        ),
+        callbacks=[*parent.get("callbacks", ()), *(router.callbacks or ())],
+        generate_unique_id_function=get_value_or_default(
+            router.generate_unique_id_function,
+            parent.get("generate_unique_id_function", Default(generate_unique_id))
+        )
+    )
+
 @dataclass
 class EndpointsRouter[T: BaseEndpoints]:
 
@@ -21,13 +69,346 @@ class EndpointsRouter[T: BaseEndpoints]:
     endpoints: T = None
     routers: list["EndpointsRouter"] = field(default_factory=list)
 
-    def include(self) -> None:
+    _index: dict[type, "EndpointsRouter"] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    _selected: dict[type, "EndpointsRouter | None"] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    _state: tuple["EndpointsRouter", ...] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _included: dict[tuple[int, str], APIRouter] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    _mounts: dict[str, "LazyMount"] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
+    def add(self, *routers: "EndpointsRouter") -> None:
+
+        self.routers.extend(routers)
+
+    def index(self) -> dict[type, "EndpointsRouter"]:
+
+        state = self._state
+        routers = self.routers
+
+        if (
+            (state is None) or
+            (len(state) != len(routers)) or
+            not all(map(operator.is_, state, routers))
+        ):
+            self._index = {}
+            self._selected = {}
+
+            for router in routers:
+                self._index.setdefault(type(router.endpoints), router)
+
+            self._state = tuple(routers)
+
+        return self._index
+
+    def walk(self) -> Generator["EndpointsRouter", None, None]:
+
+        seen = {id(self)}
+        stack = list(reversed(self.routers))
+
+        while stack:
+            router = stack.pop()
+
+            if id(router) in seen:
+                continue
+
+            seen.add(id(router))
+
+            yield router
+
+            stack.extend(reversed(router.routers))
+
+    def tree(
+            self,
+            routers: Iterable["EndpointsRouter"] = None
+    ) -> Generator[tuple["EndpointsRouter", dict[str, ...]], None, None]:
+
+        root = frozenset((id(self),))
+
+        seen = set()
+        stack = [
+            (router, self.mounted(router, {}), root) for router in
+            reversed(list(self.routers if routers is None else routers))
+        ]
+
+        while stack:
+            router, parent, ancestors = stack.pop()
+
+            key = (id(router), parent.get("prefix", ""))
+
+            if (id(router) in ancestors) or (key in seen):
+                continue
+
+            seen.add(key)
+
+            yield router, parent
+
+            nested = context(app_router(router.router), parent)
+            ancestors = ancestors | {id(router)}
+
+            stack.extend(
+                (child, router.mounted(child, nested), ancestors)
+                for child in reversed(router.routers)
+                if (id(app_router(child.router)), "") not in router._included
+            )
+
+    def mounted(
+            self,
+            router: "EndpointsRouter",
+            parent: dict[str, ...]
+    ) -> dict[str, ...]:
+
+        for mount in self._mounts.values():
+            if mount.router is router:
+                return {**parent, "prefix": parent.get("prefix", "") + mount.prefix}
+
+        return parent
+
+    def include(self, recursive: bool = True) -> None:
+
+        if recursive:
+            self.include_all(self.tree())
+
+        else:
+            self.include_all((router, {}) for router in self.routers)
+
+    def include_all(
+            self,
+            routers: Iterable[tuple["EndpointsRouter", dict[str, ...]]]
+    ) -> None:
+
+        target = app_router(self.router)
+
+        with ANALYSIS.activate():
+            for router, parent in routers:
+                included = app_router(router.router)
+                key = (id(included), parent.get("prefix", ""))
+
+                if (included is target) or (key in self._included):
+                    continue
+
+                self._included[key] = included
+
+                target.include_router(included, **parent)
+
+        if isinstance(self.router, FastAPI):
+            self.router.openapi_schema = None
+
+    def select[T: BaseEndpoints](
+            self,
+            base: type[T],
+            recursive: bool = False
+    ) -> "EndpointsRouter[T] | None":
+
+        if recursive:
+            for router in self.walk():
+                if isinstance(router.endpoints, base):
+                    return router
+
+            return None
+
+        index = self.index()
+
+        if base in self._selected:
+            return self._selected[base]
+
+        selected = None
+
+        for kind, router in index.items():
+            if issubclass(kind, base):
+                selected = router
+
+                break
+
+        self._selected[base] = selected
+
+        return selected
+
+    def defer(
+            self,
+            prefix: str,
+            factory: Factory,
+            warmup: bool = False,
+            hook: Callable[["LazyMount", float], ...] = None
+    ) -> "LazyMount":
+
+        if not prefix.startswith("/") or prefix.endswith("/"):
+            raise ValueError(
+                f"prefix must start with '/' and must not end with '/', "
+                f"got: '{prefix}'"
+            )
+
+        if prefix in self._mounts:
+            raise ValueError(f"A deferred router is already registered at: '{prefix}'")
+
+        mount = LazyMount(self, prefix, factory, hook=hook)
+
+        self._mounts[prefix] = mount
+
+        app_router(self.router).routes.append(mount)
+
+        changed(self.router)
+
+        if warmup:
+            extend_lifespan(self.router, startup=mount.warm)
+
+        return mount
+
+    def mounts(self) -> list["LazyMount"]:
+
+        return list(self._mounts.values())
+
+class LazyMount(BaseRoute):
+
+    def __init__(
+            self,
+            parent: EndpointsRouter,
+            prefix: str,
+            factory: Factory,
+            hook: Callable[["LazyMount", float], ...] = None
+    ) -> None:
+
+        self.parent = parent
+        self.path = prefix
+        self.prefix = prefix
+        self.factory = factory
+        self.hook = hook
+        self.name = None
+        self.include_in_schema = False
+
+        self.router: EndpointsRouter | None = None
+        self.mounted = False
+        self.duration: float | None = None
+
+        self._built: EndpointsRouter | None = None
+        self._lock = threading.Lock()
+        self._mounting: asyncio.Future | None = None
+        self._warming: asyncio.Future | None = None
+
+    def __repr__(self) -> str:
+
+        return f"{type(self).__name__}(prefix={self.prefix!r}, mounted={self.mounted})"
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+
+        if self.mounted or (scope["type"] not in ("http", "websocket")):
+            return Match.NONE, {}
+
+        path = get_route_path(scope)
+
+        if (path == self.prefix) or path.startswith(self.prefix + "/"):
+            return Match.FULL, {}
+
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: ...) -> ...:
+
+        raise NoMatchFound(name, path_params)
+
+    def build(self) -> EndpointsRouter:
+
+        if self._built is not None:
+            return self._built
+
+        with self._lock:
+            if self._built is None:
+                start = time.perf_counter()
+
+                factory = self.factory
+
+                if isinstance(factory, str):
+                    factory = resolve(factory)
+
+                if isinstance(factory, (EndpointsRouter, FastAPI, APIRouter)):
+                    value = factory
+
+                else:
+                    value = factory()
+
+                if not isinstance(value, EndpointsRouter):
+                    value = EndpointsRouter(value)
+
+                self.duration = time.perf_counter() - start
+                self._built = value
+
+                if self.hook is not None:
+                    self.hook(self, self.duration)
+
+        return self._built
+
+    def mount(self) -> EndpointsRouter:
+
+        router = self.build()
+
+        if self.mounted:
+            return router
+
+        parent = self.parent
+        target = app_router(parent.router)
+
+        self.router = router
+
+        parent.routers.append(router)
+        parent.include_all(parent.tree([router]))
+
+        if self in target.routes:
+            target.routes.remove(self)
+
+        self.mounted = True
+
+        changed(parent.router)
+
+        return router
+
+    async def ensure(self) -> EndpointsRouter:
+
+        if self.mounted:
+            return self.router
+
+        if self._mounting is None:
+            self._mounting = asyncio.ensure_future(run_in_threadpool(self.build))
+
+        mounting = self._mounting
+
+        try:
+            await asyncio.shield(mounting)
+
+        except Exception:
+            if self._mounting is mounting:
+                self._mounting = None
+
+            raise
+
+        return self.mount()
+
+    async def warm(self) -> None:
+
+        if self.mounted or (self._warming is not None):
+            return
+
+        async def mounting() -> None:
+
+            try:
+                await self.ensure()
+
+            except Exception:
+                logger.exception(f"Failed to warm up the router deferred at '{self.prefix}'")
+
+            finally:
+                self._warming = None
+
+        self._warming = asyncio.ensure_future(mounting())
 
-        for router in self.routers:
-            self.router.include_router(router.router)
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
 
-    def select[T: BaseEndpoints](self, base: type[T]) -> "EndpointsRouter[T]":
+        await self.ensure()
 
-        for router in self.routers:
-            if isinstance(router.endpoints, base):
-                return router
+        await app_router(self.parent.router).app(scope, receive, send)
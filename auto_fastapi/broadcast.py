@@ -0,0 +1,361 @@
+# broadcast.py
+
+import asyncio
+import inspect
+import contextlib
+from collections import deque
+from dataclasses import dataclass
+from functools import update_wrapper
+from typing import Callable, Iterable, AsyncGenerator
+
+from fastapi import WebSocket
+from starlette.websockets import WebSocketState
+
+from auto_fastapi.streaming import dumps
+
+__all__ = [
+    "BroadcastHub",
+    "BroadcastStats",
+    "Connection",
+    "SEND_POLICIES",
+    "build_hub"
+]
+
+DROP_OLDEST = "drop_oldest"
+EVICT = "evict"
+
+SEND_POLICIES = (DROP_OLDEST, EVICT)
+
+TRY_AGAIN_LATER = 1013
+
+PARAMETER = "hub_websocket"
+
+def parameter(signature: inspect.Signature, base: type) -> str | None:
+
+    for value in signature.parameters.values():
+        if isinstance(value.annotation, type) and issubclass(value.annotation, base):
+            return value.name
+
+    return None
+
+def frame(message: ...) -> dict[str, ...]:
+
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return {"type": "websocket.send", "bytes": bytes(message)}
+
+    if isinstance(message, str):
+        return {"type": "websocket.send", "text": message}
+
+    return {"type": "websocket.send", "text": dumps(message).decode()}
+
+@dataclass(slots=True)
+class BroadcastStats:
+
+    connections: int = 0
+    published: int = 0
+    queued: int = 0
+    sent: int = 0
+    dropped: int = 0
+    evicted: int = 0
+    peak_depth: int = 0
+
+    def data(self) -> dict[str, int]:
+
+        return dict(
+            connections=self.connections,
+            published=self.published,
+            queued=self.queued,
+            sent=self.sent,
+            dropped=self.dropped,
+            evicted=self.evicted,
+            peak_depth=self.peak_depth
+        )
+
+class Connection:
+
+    __slots__ = (
+        "hub", "websocket", "queue", "rooms",
+        "dropped", "closed", "evicted", "_wake", "__weakref__"
+    )
+
+    def __init__(self, hub: "BroadcastHub", websocket: WebSocket) -> None:
+
+        self.hub = hub
+        self.websocket = websocket
+        self.queue: deque[dict[str, ...]] = deque()
+        self.rooms: set[str] = set()
+        self.dropped = 0
+        self.closed = False
+        self.evicted = False
+
+        self._wake = asyncio.Event()
+
+    @property
+    def depth(self) -> int:
+
+        return len(self.queue)
+
+    def join(self, *rooms: str) -> None:
+
+        for room in rooms:
+            self.hub.join(self, room)
+
+    def leave(self, *rooms: str) -> None:
+
+        for room in (rooms or tuple(self.rooms)):
+            self.hub.leave(self, room)
+
+    def push(self, message: dict[str, ...]) -> bool:
+
+        if self.closed:
+            return False
+
+        hub = self.hub
+
+        if len(self.queue) >= hub.queue:
+            if hub.policy == EVICT:
+                self.evict()
+
+                return False
+
+            self.queue.popleft()
+            self.dropped += 1
+
+            hub.stats.dropped += 1
+
+        self.queue.append(message)
+
+        hub.stats.queued += 1
+
+        if len(self.queue) > hub.stats.peak_depth:
+            hub.stats.peak_depth = len(self.queue)
+
+        self._wake.set()
+
+        return True
+
+    def send(self, message: ...) -> bool:
+
+        return self.push(frame(message))
+
+    def evict(self) -> None:
+
+        if self.closed:
+            return
+
+        self.evicted = True
+        self.hub.stats.evicted += 1
+        self.hub.stats.dropped += len(self.queue)
+        self.dropped += len(self.queue)
+        self.queue.clear()
+
+        self.close()
+
+    def close(self) -> None:
+
+        self.closed = True
+        self.leave()
+        self._wake.set()
+
+    async def write(self) -> None:
+
+        send = self.websocket.send
+        stats = self.hub.stats
+
+        while True:
+            while self.queue:
+                try:
+                    await send(self.queue.popleft())
+
+                except Exception:
+                    self.close()
+
+                    return
+
+                stats.sent += 1
+
+            if self.closed:
+                break
+
+            self._wake.clear()
+
+            await self._wake.wait()
+
+        if self.evicted:
+            with contextlib.suppress(Exception):
+                await self.websocket.close(code=TRY_AGAIN_LATER)
+
+class BroadcastHub:
+
+    def __init__(self, queue: int = 256, policy: str = DROP_OLDEST) -> None:
+
+        if policy not in SEND_POLICIES:
+            raise ValueError(
+                f"policy must be one of {', '.join(SEND_POLICIES)}, "
+                f"not: {policy!r}"
+            )
+
+        if queue < 1:
+            raise ValueError(f"queue must be a positive integer, not: {queue}")
+
+        self.queue = queue
+        self.policy = policy
+
+        self.stats = BroadcastStats()
+
+        self.rooms: dict[str, set[Connection]] = {}
+        self.connections: set[Connection] = set()
+
+    def __len__(self) -> int:
+
+        return len(self.connections)
+
+    def depth(self) -> int:
+
+        return sum(len(connection.queue) for connection in self.connections)
+
+    def join(self, connection: Connection, room: str) -> None:
+
+        if connection.closed:
+            return
+
+        members = self.rooms.get(room)
+
+        if members is None:
+            members = self.rooms[room] = set()
+
+        members.add(connection)
+        connection.rooms.add(room)
+
+    def leave(self, connection: Connection, room: str) -> None:
+
+        connection.rooms.discard(room)
+
+        members = self.rooms.get(room)
+
+        if members is None:
+            return
+
+        members.discard(connection)
+
+        if not members:
+            del self.rooms[room]
+
+    def members(self, room: str) -> set[Connection]:
+
+        return self.rooms.get(room, set())
+
+    def fan_out(self, connections: Iterable[Connection], message: ...) -> int:
+
+        message = frame(message)
+
+        self.stats.published += 1
+
+        delivered = 0
+
+        for connection in tuple(connections):
+            delivered += connection.push(message)
+
+        return delivered
+
+    def publish(self, room: str, message: ...) -> int:
+
+        return self.fan_out(self.rooms.get(room, ()), message)
+
+    def broadcast(self, message: ...) -> int:
+
+        return self.fan_out(self.connections, message)
+
+    @contextlib.asynccontextmanager
+    async def connect(
+            self,
+            websocket: WebSocket,
+            rooms: Iterable[str] = ()
+    ) -> AsyncGenerator[Connection, None]:
+
+        if websocket.client_state == WebSocketState.CONNECTING:
+            await websocket.accept()
+
+        connection = Connection(self, websocket)
+
+        self.connections.add(connection)
+        self.stats.connections += 1
+
+        connection.join(*rooms)
+
+        writer = asyncio.get_running_loop().create_task(connection.write())
+
+        try:
+            yield connection
+
+            connection.close()
+
+            with contextlib.suppress(Exception):
+                await writer
+
+        finally:
+            connection.close()
+
+            writer.cancel()
+
+            self.connections.discard(connection)
+            self.stats.connections -= 1
+
+    def wrap(self, c: Callable) -> Callable:
+
+        try:
+            signature = inspect.signature(c, eval_str=True)
+
+        except (NameError, TypeError):
+            signature = inspect.signature(c)
+
+        name = parameter(signature, WebSocket)
+        connection_name = parameter(signature, Connection)
+
+        if (name is None) and (connection_name is None):
+            raise TypeError(
+                f"{type(self).__name__} can only bind handlers that take a "
+                f"{WebSocket} or a {Connection} parameter, got: {c}"
+            )
+
+        parameters = [
+            value for value in signature.parameters.values()
+            if value.name != connection_name
+        ]
+
+        injected = name is None
+
+        if injected:
+            name = PARAMETER
+
+            parameters.append(
+                inspect.Parameter(
+                    name,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=WebSocket
+                )
+            )
+
+        async def connected(*args, **kwargs) -> None:
+
+            websocket = kwargs.pop(name) if injected else kwargs[name]
+
+            async with self.connect(websocket) as connection:
+                websocket.state.connection = connection
+
+                if connection_name is not None:
+                    kwargs[connection_name] = connection
+
+                await c(*args, **kwargs)
+
+        update_wrapper(connected, c)
+
+        del connected.__wrapped__
+
+        connected.__signature__ = signature.replace(parameters=parameters)
+
+        return connected
+
+def build_hub(queue: int = 256, policy: str = DROP_OLDEST) -> BroadcastHub:
+
+    return BroadcastHub(queue=queue, policy=policy)
@@ -0,0 +1,296 @@
+# cache.py
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Coroutine, Hashable, Iterable
+
+import fastapi.routing
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+__all__ = [
+    "ResponseCache",
+    "CacheEntry",
+    "CacheStats",
+    "build_cache"
+]
+
+Handler = Callable[[Request], Coroutine[..., ..., Response]]
+
+UNCACHEABLE = {
+    "dependencies": "dependencies",
+    "header_params": "header parameters",
+    "cookie_params": "cookie parameters",
+    "body_params": "body parameters"
+}
+CONNECTIONS = (
+    "request_param_name",
+    "http_connection_param_name",
+    "security_scopes_param_name"
+)
+
+def effective(route: APIRoute) -> APIRoute:
+
+    context = getattr(fastapi.routing, "_effective_route_context_var", None)
+
+    current = None if context is None else context.get()
+
+    if (
+        (current is not None) and
+        (getattr(current, "original_route", None) is route)
+    ):
+        return current
+
+    return route
+
+def uncacheable(route: APIRoute) -> list[str]:
+
+    dependant = route.dependant
+
+    reasons = [
+        reason for name, reason in UNCACHEABLE.items()
+        if getattr(dependant, name, None)
+    ]
+
+    if any(getattr(dependant, name, None) for name in CONNECTIONS):
+        reasons.append("direct access to the request")
+
+    return reasons
+
+@dataclass(slots=True)
+class CacheEntry:
+
+    body: bytes
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    expires: float
+    size: int
+
+@dataclass(slots=True)
+class CacheStats:
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def data(self) -> dict[str, int]:
+
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations
+        )
+
+@dataclass(slots=True, eq=False)
+class ResponseCache:
+
+    ttl: float = 60.0
+    max_entries: int = 1024
+    max_bytes: int = None
+    methods: Iterable[str] = ("GET", "HEAD")
+
+    stats: CacheStats = field(default_factory=CacheStats)
+    size: int = field(init=False, default=0)
+
+    _entries: OrderedDict[Hashable, CacheEntry] = field(
+        init=False, default_factory=OrderedDict, repr=False
+    )
+    _routes: dict[type[APIRoute], type[APIRoute]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    # the key covers only the endpoint, the method, the concrete path (with
+    # its prefix and path parameters) and the query string. headers, cookies,
+    # bodies and dependencies (auth included) are not part of it, so routes
+    # that read any of them are refused when the route is built.
+    @staticmethod
+    def key(route: APIRoute, request: Request) -> Hashable:
+
+        return (
+            route.endpoint,
+            request.method,
+            request.url.path,
+            tuple(sorted(request.query_params.multi_items()))
+        )
+
+    @staticmethod
+    def check(route: APIRoute) -> None:
+
+        reasons = uncacheable(route)
+
+        if reasons:
+            raise ValueError(
+                f"Cannot cache responses of route '{route.path}' "
+                f"since it declares {', '.join(reasons)}, "
+                f"which the cache key does not cover."
+            )
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+
+            return None
+
+        if entry.expires <= time.monotonic():
+            self.pop(key)
+
+            self.stats.expirations += 1
+            self.stats.misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+
+        self.stats.hits += 1
+
+        return entry
+
+    def set(
+            self,
+            key: Hashable,
+            response: Response,
+            ttl: float = None
+    ) -> CacheEntry | None:
+
+        body = getattr(response, "body", None)
+
+        if (
+            not isinstance(body, bytes) or
+            not (200 <= response.status_code < 300) or
+            (b"set-cookie" in (name for name, _ in response.raw_headers))
+        ):
+            return None
+
+        size = len(body)
+
+        if (self.max_bytes is not None) and (size > self.max_bytes):
+            return None
+
+        self.pop(key)
+
+        entry = CacheEntry(
+            body=body,
+            status_code=response.status_code,
+            headers=list(response.raw_headers),
+            expires=time.monotonic() + (self.ttl if ttl is None else ttl),
+            size=size
+        )
+
+        self._entries[key] = entry
+        self.size += size
+
+        self.evict()
+
+        return entry
+
+    def pop(self, key: Hashable) -> CacheEntry | None:
+
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self.size -= entry.size
+
+        return entry
+
+    def evict(self) -> None:
+
+        while self._entries and (
+            (
+                (self.max_entries is not None) and
+                (len(self._entries) > self.max_entries)
+            ) or
+            (
+                (self.max_bytes is not None) and
+                (self.size > self.max_bytes)
+            )
+        ):
+            _, entry = self._entries.popitem(last=False)
+
+            self.size -= entry.size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+
+        self._entries.clear()
+        self.size = 0
+
+    def wrap(self, route: APIRoute, handler: Handler) -> Handler:
+
+        methods = frozenset(method.upper() for method in self.methods)
+
+        async def cached(request: Request) -> Response:
+
+            if request.method not in methods:
+                return await handler(request)
+
+            key = self.key(route, request)
+
+            entry = self.get(key)
+
+            if entry is None:
+                response = await handler(request)
+
+                self.set(key, response)
+
+                return response
+
+            response = Response(status_code=entry.status_code)
+            response.body = entry.body
+            response.raw_headers = list(entry.headers)
+
+            return response
+
+        return cached
+
+    def route_class(self, base: type[APIRoute] = APIRoute) -> type[APIRoute]:
+
+        route_class = self._routes.get(base)
+
+        if route_class is None:
+            cache = self
+
+            class CachedAPIRoute(base):
+
+                def get_route_handler(self) -> Handler:
+
+                    handler = super().get_route_handler()
+
+                    route = effective(self)
+
+                    if route is self:
+                        cache.check(route)
+
+                    elif uncacheable(route):
+                        return handler
+
+                    return cache.wrap(self, handler)
+
+            route_class = CachedAPIRoute
+
+            self._routes[base] = route_class
+
+        return route_class
+
+def build_cache(
+        ttl: float = 60.0,
+        max_entries: int = 1024,
+        max_bytes: int = None,
+        methods: Iterable[str] = ("GET", "HEAD")
+) -> ResponseCache:
+
+    return ResponseCache(
+        ttl=ttl,
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        methods=methods
+    )
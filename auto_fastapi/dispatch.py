@@ -0,0 +1,267 @@
+# dispatch.py
+
+import re
+from dataclasses import dataclass, field
+
+from fastapi import FastAPI, APIRouter
+from starlette.routing import (
+    BaseRoute, Route, WebSocketRoute, Match, get_route_path
+)
+from starlette.types import ASGIApp, Scope, Receive, Send
+
+try:
+    from fastapi.telemetry._api import _route_selected
+
+except ImportError:
+    _route_selected = None
+
+__all__ = [
+    "Dispatcher",
+    "dispatch"
+]
+
+PARAM = re.compile(r"^{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}$")
+
+@dataclass(slots=True)
+class Node:
+
+    static: dict[str, "Node"] = field(default_factory=dict)
+    params: dict[str, tuple[re.Pattern, "Node"]] = field(default_factory=dict)
+    remainder: list[tuple[int, BaseRoute]] = field(default_factory=list)
+    routes: list[tuple[int, BaseRoute]] = field(default_factory=list)
+
+    def child(self, segment: str, route: Route | WebSocketRoute) -> "Node":
+
+        match = PARAM.match(segment)
+
+        if match is None:
+            return self.static.setdefault(segment, Node())
+
+        regex = route.param_convertors[match.group(1)].regex
+
+        if regex not in self.params:
+            self.params[regex] = (re.compile(regex), Node())
+
+        return self.params[regex][1]
+
+    def collect(
+            self,
+            segments: list[str],
+            index: int,
+            found: list[tuple[int, BaseRoute]]
+    ) -> None:
+
+        found.extend(self.remainder)
+
+        if index == len(segments):
+            found.extend(self.routes)
+
+            return
+
+        segment = segments[index]
+
+        node = self.static.get(segment)
+
+        if node is not None:
+            node.collect(segments, index + 1, found)
+
+        for pattern, node in self.params.values():
+            if pattern.fullmatch(segment):
+                node.collect(segments, index + 1, found)
+
+def segments(path: str) -> list[str] | None:
+
+    if not path.startswith("/"):
+        return None
+
+    return path[1:].split("/")
+
+def select(scope: Scope, route: BaseRoute, child_scope: Scope) -> None:
+
+    scope.update(child_scope)
+
+    if _route_selected is not None:
+        _route_selected(scope=scope, path=getattr(route, "path_format", None))
+
+class Dispatcher:
+
+    def __init__(self, router: APIRouter) -> None:
+
+        self.router = router
+
+        self.fallback: ASGIApp = router.middleware_stack
+
+        self.tree: Node | None = None
+        self.opaque: int | None = None
+
+        self._routes: list[BaseRoute] | None = None
+        self._count = 0
+
+    @property
+    def installed(self) -> bool:
+
+        return self.router.middleware_stack is self
+
+    def install(self) -> bool:
+
+        if self.installed:
+            return True
+
+        if self.router.middleware_stack != self.router.app:
+            return False
+
+        self.fallback = self.router.middleware_stack
+        self.router.middleware_stack = self
+
+        self.invalidate()
+
+        return True
+
+    def uninstall(self) -> None:
+
+        if self.installed:
+            self.router.middleware_stack = self.fallback
+
+        self.invalidate()
+
+    def invalidate(self) -> None:
+
+        self.tree = None
+        self.opaque = None
+        self._routes = None
+
+    def compile(self) -> Node:
+
+        tree = Node()
+        opaque = None
+
+        routes = self.router.routes
+
+        for index, route in enumerate(routes):
+            if not self.insert(tree, index, route) and opaque is None:
+                opaque = index
+
+        self.tree = tree
+        self.opaque = opaque
+
+        self._routes = routes
+        self._count = len(routes)
+
+        return tree
+
+    @staticmethod
+    def insert(tree: Node, index: int, route: BaseRoute) -> bool:
+
+        if not isinstance(route, (Route, WebSocketRoute)):
+            return False
+
+        parts = segments(route.path)
+
+        if parts is None:
+            return False
+
+        for i, part in enumerate(parts):
+            match = PARAM.match(part)
+
+            if (match is None) and ("{" in part or "}" in part):
+                return False
+
+            if (match is not None) and (match.group(1) not in route.param_convertors):
+                return False
+
+            if (match is not None) and (match.group(2) == ":path") and (i != len(parts) - 1):
+                return False
+
+        node = tree
+
+        for part in parts:
+            match = PARAM.match(part)
+
+            if (match is not None) and (match.group(2) == ":path"):
+                node.remainder.append((index, route))
+
+                return True
+
+            node = node.child(part, route)
+
+        node.routes.append((index, route))
+
+        return True
+
+    def candidates(self, scope: Scope) -> list[tuple[int, BaseRoute]] | None:
+
+        routes = self.router.routes
+
+        if (
+            (self.tree is None) or
+            (routes is not self._routes) or
+            (len(routes) != self._count)
+        ):
+            self.compile()
+
+        parts = segments(get_route_path(scope))
+
+        if parts is None:
+            return None
+
+        found = []
+
+        self.tree.collect(parts, 0, found)
+
+        found.sort(key=lambda item: item[0])
+
+        return found
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+
+        if scope["type"] not in ("http", "websocket"):
+            await self.fallback(scope, receive, send)
+
+            return
+
+        partial = None
+
+        for index, route in self.candidates(scope) or ():
+            if (self.opaque is not None) and (index > self.opaque):
+                break
+
+            match, child_scope = route.matches(scope)
+
+            if match == Match.FULL:
+                scope.setdefault("router", self.router)
+
+                select(scope, route, child_scope)
+
+                await route.handle(scope, receive, send)
+
+                return
+
+            elif (match == Match.PARTIAL) and (partial is None):
+                partial = (route, child_scope)
+
+        if (partial is not None) and (self.opaque is None):
+            route, child_scope = partial
+
+            scope.setdefault("router", self.router)
+
+            select(scope, route, child_scope)
+
+            await route.handle(scope, receive, send)
+
+            return
+
+        await self.fallback(scope, receive, send)
+
+def dispatch(app: FastAPI | APIRouter) -> Dispatcher | None:
+
+    router = app.router if isinstance(app, FastAPI) else app
+
+    if isinstance(router.middleware_stack, Dispatcher):
+        return router.middleware_stack
+
+    dispatcher = Dispatcher(router)
+
+    if not dispatcher.install():
+        return None
+
+    return dispatcher
@@ -0,0 +1,332 @@
+# executor.py
+
+import os
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Executor as PoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from enum import Enum
+from dataclasses import dataclass, field
+from functools import wraps, partial
+from typing import Callable
+
+from fastapi import FastAPI, APIRouter
+from starlette.concurrency import run_in_threadpool
+
+from auto_fastapi.lazy import LazyCallable, call
+from auto_fastapi.lifespan import extend_lifespan
+
+__all__ = [
+    "ExecutorKind",
+    "Executor",
+    "Executors",
+    "PoolStats",
+    "Pool",
+    "EXECUTORS",
+    "build_executor"
+]
+
+class ExecutorKind(Enum):
+
+    LOOP = "loop"
+    THREAD = "thread"
+    PROCESS = "process"
+
+@dataclass(slots=True)
+class PoolStats:
+
+    workers: int
+    submitted: int = 0
+    completed: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak: int = 0
+    saturated: int = 0
+
+    @property
+    def queued(self) -> int:
+
+        return max(self.in_flight - self.workers, 0)
+
+    @property
+    def saturation(self) -> float:
+
+        return min(self.in_flight / self.workers, 1.0)
+
+    def data(self) -> dict[str, int | float]:
+
+        return dict(
+            workers=self.workers,
+            submitted=self.submitted,
+            completed=self.completed,
+            errors=self.errors,
+            in_flight=self.in_flight,
+            queued=self.queued,
+            peak=self.peak,
+            saturated=self.saturated,
+            saturation=self.saturation
+        )
+
+@dataclass(slots=True, eq=False)
+class Pool:
+
+    executor: "Executor"
+    stats: PoolStats
+    pool: PoolExecutor = None
+    users: int = 0
+
+    def start(self) -> PoolExecutor:
+
+        if self.pool is None:
+            if self.executor.kind == ExecutorKind.PROCESS:
+                self.pool = ProcessPoolExecutor(max_workers=self.executor.workers)
+
+            else:
+                self.pool = ThreadPoolExecutor(
+                    max_workers=self.executor.workers,
+                    thread_name_prefix=self.executor.name
+                )
+
+        return self.pool
+
+    def stop(self, wait: bool = True) -> None:
+
+        pool = self.pool
+
+        self.pool = None
+
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    async def run(self, c: Callable, *args, **kwargs) -> ...:
+
+        stats = self.stats
+
+        stats.submitted += 1
+
+        if stats.in_flight >= stats.workers:
+            stats.saturated += 1
+
+        stats.in_flight += 1
+        stats.peak = max(stats.peak, stats.in_flight)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.start(), partial(c, *args, **kwargs)
+            )
+
+        except BaseException:
+            stats.errors += 1
+
+            raise
+
+        finally:
+            stats.in_flight -= 1
+            stats.completed += 1
+
+@dataclass(slots=True, frozen=True)
+class Executor:
+
+    name: str = None
+    kind: ExecutorKind = ExecutorKind.THREAD
+    workers: int = None
+    registry: "Executors" = field(default=None, compare=False, repr=False)
+
+    def attach(self, app: FastAPI | APIRouter) -> None:
+
+        (self.registry or EXECUTORS).attach(app, self)
+
+    def wrap(self, c: Callable) -> Callable:
+
+        if isinstance(c, LazyCallable):
+            return self.wrap_lazy(c)
+
+        if (
+            inspect.iscoroutinefunction(c) or
+            inspect.isgeneratorfunction(c) or
+            inspect.isasyncgenfunction(c)
+        ):
+            raise TypeError(
+                f"{self} can only run plain sync callables, got: {c}"
+            )
+
+        if self.kind == ExecutorKind.LOOP:
+            @wraps(c)
+            async def execute(*args, **kwargs) -> ...:
+
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, partial(c, *args, **kwargs)
+                )
+
+            return execute
+
+        pool = (self.registry or EXECUTORS).pool(self)
+
+        @wraps(c)
+        async def execute(*args, **kwargs) -> ...:
+
+            return await pool.run(c, *args, **kwargs)
+
+        return execute
+
+    def wrap_lazy(self, c: LazyCallable) -> Callable:
+
+        if self.kind == ExecutorKind.LOOP:
+            async def execute(*args, **kwargs) -> ...:
+
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, partial(c.resolve(), *args, **kwargs)
+                )
+
+        else:
+            pool = (self.registry or EXECUTORS).pool(self)
+
+            async def execute(*args, **kwargs) -> ...:
+
+                return await pool.run(call, c.reference, *args, **kwargs)
+
+        execute.__name__ = c.__name__
+        execute.__wrapped__ = c
+
+        return execute
+
+class Executors:
+
+    def __init__(self) -> None:
+
+        self.pools: dict[str, Pool] = {}
+        self.apps: dict[int, set[str]] = {}
+
+        self._lock = threading.Lock()
+
+    def executor(
+            self,
+            name: str = None,
+            kind: ExecutorKind = ExecutorKind.THREAD,
+            workers: int = None
+    ) -> Executor:
+
+        if kind == ExecutorKind.LOOP:
+            return Executor(name=name, kind=kind, registry=self)
+
+        if name is None:
+            raise ValueError(f"{kind} executors must be given a name.")
+
+        with self._lock:
+            pool = self.pools.get(name)
+
+            if pool is not None:
+                if (pool.executor.kind, workers) not in (
+                    (kind, None), (kind, pool.executor.workers)
+                ):
+                    raise ValueError(
+                        f"Executor '{name}' is already defined as {pool.executor}."
+                    )
+
+                return pool.executor
+
+            executor = Executor(
+                name=name,
+                kind=kind,
+                workers=workers or self.workers(kind),
+                registry=self
+            )
+
+            self.pools[name] = Pool(
+                executor=executor,
+                stats=PoolStats(workers=executor.workers)
+            )
+
+            return executor
+
+    @staticmethod
+    def workers(kind: ExecutorKind) -> int:
+
+        if kind == ExecutorKind.PROCESS:
+            return os.cpu_count() or 1
+
+        return min(32, (os.cpu_count() or 1) + 4)
+
+    def pool(self, executor: Executor) -> Pool:
+
+        pool = self.pools.get(executor.name)
+
+        if pool is None or pool.executor != executor:
+            executor = self.executor(
+                name=executor.name,
+                kind=executor.kind,
+                workers=executor.workers
+            )
+
+            pool = self.pools[executor.name]
+
+        return pool
+
+    def stats(self) -> dict[str, PoolStats]:
+
+        return {name: pool.stats for name, pool in self.pools.items()}
+
+    def acquire(self, names: set[str]) -> None:
+
+        with self._lock:
+            for name in names:
+                self.pools[name].users += 1
+                self.pools[name].start()
+
+    def release(self, names: set[str], wait: bool = True) -> None:
+
+        with self._lock:
+            pools = []
+
+            for name in names:
+                pool = self.pools[name]
+
+                pool.users = max(pool.users - 1, 0)
+
+                if not pool.users:
+                    pools.append(pool)
+
+        for pool in pools:
+            pool.stop(wait=wait)
+
+    def attach(self, app: FastAPI | APIRouter, executor: Executor) -> None:
+
+        if executor.kind == ExecutorKind.LOOP:
+            return
+
+        names = self.apps.get(id(app))
+
+        if names is None:
+            names = self.apps[id(app)] = set()
+
+            async def startup() -> None:
+
+                self.acquire(names)
+
+            async def shutdown() -> None:
+
+                await run_in_threadpool(self.release, names)
+
+            extend_lifespan(app, startup=startup, shutdown=shutdown)
+
+        names.add(executor.name)
+
+    def shutdown(self, wait: bool = True) -> None:
+
+        for pool in self.pools.values():
+            pool.users = 0
+            pool.stop(wait=wait)
+
+EXECUTORS = Executors()
+
+def build_executor(
+        name: str = None,
+        kind: ExecutorKind = ExecutorKind.THREAD,
+        workers: int = None,
+        registry: Executors = None
+) -> Executor:
+
+    return (registry or EXECUTORS).executor(
+        name=name, kind=kind, workers=workers
+    )
@@ -0,0 +1,142 @@
+# flight.py
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Hashable, Awaitable
+
+from starlette.concurrency import run_in_threadpool
+
+__all__ = [
+    "SingleFlight",
+    "FlightStats",
+    "build_single_flight",
+    "freeze"
+]
+
+@dataclass(slots=True)
+class FlightStats:
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+    def data(self) -> dict[str, int]:
+
+        return dict(
+            calls=self.calls,
+            executions=self.executions,
+            coalesced=self.coalesced,
+            errors=self.errors
+        )
+
+def freeze(value: ...) -> Hashable:
+
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, freeze(v)) for k, v in value.items())))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(v) for v in value))
+
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(freeze(v) for v in value))
+
+    hash(value)
+
+    return value
+
+@dataclass(slots=True, eq=False)
+class SingleFlight:
+
+    stats: FlightStats = field(default_factory=FlightStats)
+
+    _flights: dict[Hashable, asyncio.Task] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __len__(self) -> int:
+
+        return len(self._flights)
+
+    @staticmethod
+    def key(c: Callable, args: tuple, kwargs: dict[str, ...]) -> Hashable | None:
+
+        try:
+            return (
+                asyncio.get_running_loop(),
+                c,
+                freeze(args),
+                freeze(kwargs)
+            )
+
+        except TypeError:
+            return None
+
+    async def call(
+            self,
+            c: Callable[..., Awaitable],
+            key: Hashable | None,
+            *args,
+            **kwargs
+    ) -> ...:
+
+        self.stats.calls += 1
+
+        if key is None:
+            self.stats.executions += 1
+
+            return await c(*args, **kwargs)
+
+        flight = self._flights.get(key)
+
+        if flight is None:
+            self.stats.executions += 1
+
+            flight = asyncio.ensure_future(c(*args, **kwargs))
+            flight.add_done_callback(lambda task: self.land(key, task))
+
+            self._flights[key] = flight
+
+        else:
+            self.stats.coalesced += 1
+
+        return await asyncio.shield(flight)
+
+    def land(self, key: Hashable, flight: asyncio.Task) -> None:
+
+        if self._flights.get(key) is flight:
+            self._flights.pop(key)
+
+        if not flight.cancelled() and (flight.exception() is not None):
+            self.stats.errors += 1
+
+    def wrap(self, c: Callable) -> Callable:
+
+        if inspect.isgeneratorfunction(c) or inspect.isasyncgenfunction(c):
+            return c
+
+        if (
+            inspect.iscoroutinefunction(c) or
+            inspect.iscoroutinefunction(getattr(c, "__call__", None))
+        ):
+            execute = c
+
+        else:
+            async def execute(*args, **kwargs) -> ...:
+
+                return await run_in_threadpool(c, *args, **kwargs)
+
+        @wraps(c)
+        async def coalesced(*args, **kwargs) -> ...:
+
+            return await self.call(
+                execute, self.key(c, args, kwargs), *args, **kwargs
+            )
+
+        return coalesced
+
+def build_single_flight() -> SingleFlight:
+
+    return SingleFlight()
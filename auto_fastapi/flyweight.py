@@ -0,0 +1,71 @@
+# flyweight.py
+
+import weakref
+from dataclasses import fields, replace
+from typing import Hashable, TypeVar
+
+from auto_fastapi.flight import freeze
+
+__all__ = [
+    "intern",
+    "override",
+    "spec_key",
+    "interned"
+]
+
+_S = TypeVar("_S")
+
+_SPECS: weakref.WeakValueDictionary[Hashable, ...] = weakref.WeakValueDictionary()
+_FIELDS: dict[type, tuple[str, ...]] = {}
+
+def hashable(value: ...) -> Hashable:
+
+    if isinstance(value, (list, tuple, dict, set, frozenset)):
+        try:
+            return freeze(value)
+
+        except TypeError:
+            return id, id(value)
+
+    try:
+        hash(value)
+
+    except TypeError:
+        return id, id(value)
+
+    return value
+
+def spec_key(spec: ...) -> Hashable:
+
+    names = _FIELDS.get(type(spec))
+
+    if names is None:
+        names = _FIELDS[type(spec)] = tuple(
+            f.name for f in fields(spec) if f.compare
+        )
+
+    return type(spec), *(hashable(getattr(spec, name)) for name in names)
+
+def intern(spec: _S) -> _S:
+
+    key = spec_key(spec)
+
+    existing = _SPECS.get(key)
+
+    if existing is not None:
+        return existing
+
+    _SPECS[key] = spec
+
+    return spec
+
+def override(spec: _S, **changes) -> _S:
+
+    if not changes:
+        return spec
+
+    return intern(replace(spec, **changes))
+
+def interned() -> int:
+
+    return len(_SPECS)
@@ -0,0 +1,171 @@
+# lazy.py
+
+import time
+import logging
+import asyncio
+import inspect
+import threading
+import importlib
+from dataclasses import dataclass, field
+from typing import Callable
+
+from fastapi import FastAPI, APIRouter
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from auto_fastapi.lifespan import extend_lifespan
+
+__all__ = [
+    "LazyCallable",
+    "build_lazy",
+    "resolve",
+    "call"
+]
+
+logger = logging.getLogger(__name__)
+
+def resolve(reference: str) -> Callable:
+
+    module_name, _, attributes = reference.partition(":")
+
+    if not (module_name and attributes):
+        raise ValueError(
+            f"reference must be of the form 'package.module:function', "
+            f"got: '{reference}'"
+        )
+
+    value = importlib.import_module(module_name)
+
+    for attribute in attributes.split("."):
+        value = getattr(value, attribute)
+
+    return value
+
+def call(reference: str, *args, **kwargs) -> ...:
+
+    return resolve(reference)(*args, **kwargs)
+
+def model_signature(model: type[BaseModel]) -> inspect.Signature:
+
+    return inspect.Signature(
+        [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=info.annotation,
+                default=(
+                    inspect.Parameter.empty if info.is_required() else
+                    info.get_default(call_default_factory=True)
+                )
+            )
+            for name, info in model.model_fields.items()
+        ]
+    )
+
+@dataclass(eq=False)
+class LazyCallable:
+
+    reference: str
+    signature: inspect.Signature | Callable | type[BaseModel]
+    warmup: bool = False
+    hook: Callable[["LazyCallable", float], ...] = None
+
+    duration: float = field(init=False, default=None)
+
+    _resolved: Callable = field(init=False, default=None, repr=False)
+    _lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False
+    )
+    _warming: asyncio.Future = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+
+        self.__name__ = self.reference.rpartition(":")[2].replace(".", "_")
+
+        if isinstance(self.signature, inspect.Signature):
+            self.__signature__ = self.signature
+
+        elif isinstance(self.signature, type) and issubclass(self.signature, BaseModel):
+            self.__signature__ = model_signature(self.signature)
+
+        elif callable(self.signature):
+            self.__wrapped__ = self.signature
+
+        else:
+            raise TypeError(
+                f"signature must be an {inspect.Signature}, a callable "
+                f"or a subclass of {BaseModel}, got: {self.signature}"
+            )
+
+    @property
+    def resolved(self) -> bool:
+
+        return self._resolved is not None
+
+    def resolve(self) -> Callable:
+
+        if self._resolved is not None:
+            return self._resolved
+
+        with self._lock:
+            if self._resolved is None:
+                start = time.perf_counter()
+
+                c = resolve(self.reference)
+
+                self.duration = time.perf_counter() - start
+                self._resolved = c
+
+                if self.hook is not None:
+                    self.hook(self, self.duration)
+
+        return self._resolved
+
+    async def __call__(self, *args, **kwargs) -> ...:
+
+        c = self._resolved
+
+        if c is None:
+            c = await run_in_threadpool(self.resolve)
+
+        if inspect.iscoroutinefunction(c):
+            return await c(*args, **kwargs)
+
+        return await run_in_threadpool(c, *args, **kwargs)
+
+    async def warm(self) -> None:
+
+        if self.resolved or (self._warming is not None):
+            return
+
+        async def resolution() -> None:
+
+            try:
+                await run_in_threadpool(self.resolve)
+
+            except Exception:
+                logger.exception(f"Failed to warm up '{self.reference}'")
+
+            finally:
+                self._warming = None
+
+        self._warming = asyncio.ensure_future(resolution())
+
+    def attach(self, app: FastAPI | APIRouter) -> None:
+
+        if self.warmup:
+            extend_lifespan(app, startup=self.warm)
+
+def build_lazy(
+        reference: str,
+        signature: inspect.Signature | Callable | type[BaseModel],
+        warmup: bool = False,
+        hook: Callable[[LazyCallable, float], ...] = None
+) -> LazyCallable:
+
+    return LazyCallable(
+        reference=reference,
+        signature=signature,
+        warmup=warmup,
+        hook=hook
+    )
@@ -0,0 +1,36 @@
+# lifespan.py
+
+from contextlib import asynccontextmanager
+from typing import Callable, Awaitable, AsyncIterator
+
+from fastapi import FastAPI, APIRouter
+
+__all__ = [
+    "extend_lifespan"
+]
+
+def extend_lifespan(
+        app: FastAPI | APIRouter,
+        startup: Callable[[], Awaitable] = None,
+        shutdown: Callable[[], Awaitable] = None
+) -> None:
+
+    router = app.router if isinstance(app, FastAPI) else app
+
+    context = router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(target: ...) -> AsyncIterator:
+
+        if startup is not None:
+            await startup()
+
+        try:
+            async with context(target) as state:
+                yield state
+
+        finally:
+            if shutdown is not None:
+                await shutdown()
+
+    router.lifespan_context = lifespan
@@ -0,0 +1,247 @@
+# metrics.py
+
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from fastapi import FastAPI, APIRouter, Response
+from starlette.routing import BaseRoute
+from starlette.types import Scope, Receive, Send, Message
+
+__all__ = [
+    "Metrics",
+    "Series",
+    "build_metrics",
+    "BUCKETS",
+    "CONTENT_TYPE"
+]
+
+BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+STATUSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+def escape(value: str) -> str:
+
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\"", "\\\"")
+        .replace("\n", "\\n")
+    )
+
+def number(value: float) -> str:
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+@dataclass(slots=True, eq=False)
+class Series:
+
+    path: str
+    method: str
+    buckets: tuple[float, ...]
+
+    requests: int = 0
+    in_flight: int = 0
+    total: float = 0.0
+
+    statuses: list[int] = field(init=False)
+    counts: list[int] = field(init=False)
+    labels: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+
+        self.statuses = [0] * len(STATUSES)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.labels = (
+            f"path=\"{escape(self.path)}\",method=\"{escape(self.method)}\""
+        )
+
+    def observe(self, status: int, duration: float) -> None:
+
+        self.requests += 1
+        self.total += duration
+        self.statuses[min(max(status // 100, 1), 5) - 1] += 1
+        self.counts[bisect_left(self.buckets, duration)] += 1
+
+    def data(self) -> dict[str, ...]:
+
+        return dict(
+            path=self.path,
+            method=self.method,
+            requests=self.requests,
+            in_flight=self.in_flight,
+            total=self.total,
+            statuses=dict(zip(STATUSES, self.statuses)),
+            buckets=dict(zip((*self.buckets, float("inf")), self.counts))
+        )
+
+class Metrics:
+
+    def __init__(
+            self,
+            path: str = "/metrics",
+            buckets: Iterable[float] = BUCKETS,
+            prefix: str = "auto_fastapi"
+    ) -> None:
+
+        self.path = path
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+
+        self.series: dict[tuple[str, str], Series] = {}
+        self.apps: set[int] = set()
+
+    def get(self, path: str, method: str) -> Series:
+
+        key = (path, method)
+
+        series = self.series.get(key)
+
+        if series is None:
+            series = self.series[key] = Series(
+                path=path, method=method, buckets=self.buckets
+            )
+
+        return series
+
+    def instrument(self, route: BaseRoute) -> None:
+
+        app = getattr(route, "app", None)
+        methods = getattr(route, "methods", None)
+
+        if (app is None) or (methods is None) or (getattr(app, "metrics", None) is self):
+            return
+
+        path = route.path
+        table = {method: self.get(path, method) for method in methods}
+
+        async def instrumented(scope: Scope, receive: Receive, send: Send) -> None:
+
+            method = scope["method"]
+
+            series = table.get(method)
+
+            if series is None:
+                series = table[method] = self.get(path, method)
+
+            status = 500
+
+            async def observe(message: Message) -> None:
+
+                nonlocal status
+
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+
+                await send(message)
+
+            series.in_flight += 1
+
+            start = time.perf_counter()
+
+            try:
+                await app(scope, receive, observe)
+
+            finally:
+                series.in_flight -= 1
+                series.observe(status, time.perf_counter() - start)
+
+        instrumented.metrics = self
+        instrumented.__wrapped__ = app
+
+        route.app = instrumented
+
+    def instrument_all(self, routes: Iterable[BaseRoute]) -> None:
+
+        for route in routes:
+            self.instrument(route)
+
+    def attach(self, app: FastAPI | APIRouter) -> None:
+
+        if (self.path is None) or (id(app) in self.apps):
+            return
+
+        self.apps.add(id(app))
+
+        router = app.router if isinstance(app, FastAPI) else app
+
+        router.add_api_route(
+            self.path,
+            self.endpoint,
+            methods=["GET"],
+            include_in_schema=False,
+            response_class=Response
+        )
+
+    async def endpoint(self) -> Response:
+
+        return Response(self.render(), media_type=CONTENT_TYPE)
+
+    def render(self) -> str:
+
+        prefix = self.prefix
+        series = list(self.series.values())
+
+        lines = [
+            f"# HELP {prefix}_requests_total Requests handled by endpoint, method and status class.",
+            f"# TYPE {prefix}_requests_total counter"
+        ]
+
+        for s in series:
+            for status, count in zip(STATUSES, s.statuses):
+                if count:
+                    lines.append(
+                        f"{prefix}_requests_total{{{s.labels},status=\"{status}\"}} {count}"
+                    )
+
+        lines.extend(
+            (
+                f"# HELP {prefix}_requests_in_flight Requests currently being handled.",
+                f"# TYPE {prefix}_requests_in_flight gauge"
+            )
+        )
+
+        for s in series:
+            lines.append(f"{prefix}_requests_in_flight{{{s.labels}}} {s.in_flight}")
+
+        lines.extend(
+            (
+                f"# HELP {prefix}_request_duration_seconds Request latency.",
+                f"# TYPE {prefix}_request_duration_seconds histogram"
+            )
+        )
+
+        bounds = [number(bound) for bound in self.buckets] + ["+Inf"]
+
+        for s in series:
+            cumulative = 0
+
+            for bound, count in zip(bounds, s.counts):
+                cumulative += count
+
+                lines.append(
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f"{{{s.labels},le=\"{bound}\"}} {cumulative}"
+                )
+
+            lines.append(
+                f"{prefix}_request_duration_seconds_sum{{{s.labels}}} {number(s.total)}"
+            )
+            lines.append(
+                f"{prefix}_request_duration_seconds_count{{{s.labels}}} {s.requests}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+def build_metrics(
+        path: str = "/metrics",
+        buckets: Iterable[float] = BUCKETS,
+        prefix: str = "auto_fastapi"
+) -> Metrics:
+
+    return Metrics(path=path, buckets=buckets, prefix=prefix)
@@ -0,0 +1,251 @@
+# profiler.py
+
+import json
+import time
+import contextlib
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Generator, Iterable
+
+import fastapi.routing
+
+__all__ = [
+    "Profiler",
+    "Registration",
+    "profiled",
+    "PHASES"
+]
+
+PHASES = ("bind", "build", "add", "dependant", "response_field")
+
+FASTAPI_PHASES = {
+    "get_dependant": "dependant",
+    "create_model_field": "response_field",
+    "create_response_field": "response_field"
+}
+
+LABELS = ("path", "event_type", "middleware_type", "exc_class_or_status_code")
+
+_PROFILER: ContextVar["Profiler | None"] = ContextVar("profiler", default=None)
+
+def identity(c: Callable | str) -> int | str:
+
+    reference = getattr(c, "reference", c)
+
+    return reference if isinstance(reference, str) else id(c)
+
+def name(c: Callable | str) -> str:
+
+    if isinstance(c, str):
+        return c
+
+    reference = getattr(c, "reference", None)
+
+    if isinstance(reference, str):
+        return reference
+
+    return getattr(c, "__qualname__", None) or getattr(c, "__name__", None) or repr(c)
+
+def label(item: ...) -> str:
+
+    data = getattr(item, "data", None)
+
+    if data is None:
+        return ""
+
+    data = data()
+
+    for key in LABELS:
+        if data.get(key) is not None:
+            return str(data[key])
+
+    return ""
+
+@dataclass(slots=True)
+class Registration:
+
+    name: str
+    label: str
+    kind: str
+    total: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def data(self) -> dict[str, ...]:
+
+        return dict(
+            name=self.name,
+            label=self.label,
+            kind=self.kind,
+            total=self.total,
+            phases=self.phases.copy()
+        )
+
+class Profiler:
+
+    def __init__(self) -> None:
+
+        self.registrations: dict[tuple[int | str, str], Registration] = {}
+        self.totals: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+        self._stack: list[Registration] = []
+        self._token: Token | None = None
+        self._patched: dict[str, Callable] = {}
+
+    def __enter__(self) -> "Profiler":
+
+        self._token = _PROFILER.set(self)
+
+        self.patch()
+
+        return self
+
+    def __exit__(self, *_) -> None:
+
+        self.unpatch()
+
+        _PROFILER.reset(self._token)
+
+        self._token = None
+
+    def patch(self) -> None:
+
+        for attribute, phase in FASTAPI_PHASES.items():
+            original = getattr(fastapi.routing, attribute, None)
+
+            if (original is None) or (attribute in self._patched):
+                continue
+
+            self._patched[attribute] = original
+
+            setattr(fastapi.routing, attribute, self.wrap(phase, original))
+
+    def unpatch(self) -> None:
+
+        for attribute, original in self._patched.items():
+            setattr(fastapi.routing, attribute, original)
+
+        self._patched.clear()
+
+    def wrap(self, phase: str, c: Callable) -> Callable:
+
+        @wraps(c)
+        def measured(*args, **kwargs) -> ...:
+
+            with self.measure(phase):
+                return c(*args, **kwargs)
+
+        return measured
+
+    def registration(self, c: Callable | str, item: ...) -> Registration:
+
+        key = (identity(c), label(item))
+
+        registration = self.registrations.get(key)
+
+        if registration is None:
+            registration = Registration(
+                name=name(c),
+                label=key[1],
+                kind=type(item).__name__
+            )
+
+            self.registrations[key] = registration
+
+        return registration
+
+    @contextlib.contextmanager
+    def measure(
+            self,
+            phase: str,
+            c: Callable = None,
+            item: ... = None
+    ) -> Generator[None, None, None]:
+
+        if c is not None:
+            registration = self.registration(c, item)
+
+        elif self._stack:
+            registration = self._stack[-1]
+
+        else:
+            registration = None
+
+        top = not self._stack
+
+        if registration is not None:
+            self._stack.append(registration)
+
+        start = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            duration = time.perf_counter() - start
+
+            if registration is not None:
+                self._stack.pop()
+
+                registration.phases[phase] = (
+                    registration.phases.get(phase, 0.0) + duration
+                )
+
+                if top:
+                    registration.total += duration
+
+            self.totals[phase] = self.totals.get(phase, 0.0) + duration
+
+    def slowest(self, limit: int = None) -> list[Registration]:
+
+        registrations = sorted(
+            self.registrations.values(),
+            key=lambda registration: registration.total,
+            reverse=True
+        )
+
+        return registrations if limit is None else registrations[:limit]
+
+    def report(self, limit: int = None) -> dict[str, ...]:
+
+        return dict(
+            registrations=len(self.registrations),
+            totals=self.totals.copy(),
+            slowest=[registration.data() for registration in self.slowest(limit)]
+        )
+
+    def json(self, limit: int = None, indent: int = 4) -> str:
+
+        return json.dumps(self.report(limit), indent=indent)
+
+    def save(self, path: str, limit: int = None) -> None:
+
+        with open(path, "w") as file:
+            file.write(self.json(limit))
+
+def profiled(
+        phase: str,
+        locate: Callable[..., tuple[Callable, ...]]
+) -> Callable[[Callable], Callable]:
+
+    def decorator(c: Callable) -> Callable:
+
+        @wraps(c)
+        def measured(*args, **kwargs) -> ...:
+
+            profiler = _PROFILER.get()
+
+            if profiler is None:
+                return c(*args, **kwargs)
+
+            with profiler.measure(phase, *locate(*args, **kwargs)):
+                return c(*args, **kwargs)
+
+        return measured
+
+    return decorator
+
+def first(args: Iterable, kwargs: dict[str, ...]) -> ...:
+
+    for value in (*args, *kwargs.values()):
+        return value
@@ -0,0 +1,284 @@
+# scheduler.py
+
+import time
+import asyncio
+import inspect
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Hashable
+
+from auto_fastapi.flight import freeze
+from auto_fastapi.analysis import Identity
+
+__all__ = [
+    "Scheduler",
+    "Schedule",
+    "NodeTiming",
+    "graph",
+    "fingerprint"
+]
+
+def graph(root: "Automation") -> list["Automation"]:
+
+    order = []
+    states: dict[int, bool] = {}
+    stack = [(root, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        key = id(node)
+
+        if expanded:
+            states[key] = True
+            order.append(node)
+
+            continue
+
+        state = states.get(key)
+
+        if state is True:
+            continue
+
+        if state is False:
+            raise ValueError(f"Automation graph contains a cycle at: {name(node)}")
+
+        states[key] = False
+        stack.append((node, True))
+
+        for automation in reversed(node.automations):
+            if states.get(id(automation)) is False:
+                raise ValueError(
+                    f"Automation graph contains a cycle at: {name(automation)}"
+                )
+
+            if id(automation) not in states:
+                stack.append((automation, False))
+
+    return order
+
+def name(node: "Automation") -> str:
+
+    operation = node.operation
+
+    return (
+        getattr(operation, "__qualname__", None) or
+        getattr(operation, "__name__", None) or
+        repr(operation)
+    )
+
+def key(value: ...) -> Hashable:
+
+    try:
+        return freeze(value)
+
+    except TypeError:
+        return Identity(value)
+
+def operation_key(operation: ...) -> Hashable:
+
+    if isinstance(operation, partial):
+        return (
+            partial,
+            operation_key(operation.func),
+            key(operation.args),
+            key(operation.keywords)
+        )
+
+    return key(operation)
+
+def fingerprint(node: "Automation", router: "EndpointsRouter") -> Hashable:
+
+    return (
+        Identity(router),
+        operation_key(node.operation),
+        key(node.inputs),
+        tuple(
+            (automation.fingerprint, key(automation.result))
+            for automation in node.automations
+        )
+    )
+
+@dataclass(slots=True)
+class NodeTiming:
+
+    name: str
+    start: float = 0.0
+    duration: float = 0.0
+    offloaded: bool = False
+    skipped: bool = False
+
+    def data(self) -> dict[str, ...]:
+
+        return dict(
+            name=self.name,
+            start=self.start,
+            duration=self.duration,
+            offloaded=self.offloaded,
+            skipped=self.skipped
+        )
+
+@dataclass(slots=True)
+class Schedule:
+
+    nodes: int = 0
+    skipped: int = 0
+    duration: float = 0.0
+    timings: list[NodeTiming] = field(default_factory=list)
+
+    def slowest(self, limit: int = None) -> list[NodeTiming]:
+
+        timings = sorted(self.timings, key=lambda timing: timing.duration, reverse=True)
+
+        return timings if limit is None else timings[:limit]
+
+    def data(self) -> dict[str, ...]:
+
+        return dict(
+            nodes=self.nodes,
+            skipped=self.skipped,
+            duration=self.duration,
+            timings=[timing.data() for timing in self.timings]
+        )
+
+class Scheduler:
+
+    def __init__(self, workers: int = None) -> None:
+
+        self.workers = workers
+
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "Scheduler":
+
+        return self
+
+    def __exit__(self, *_) -> None:
+
+        self.close()
+
+    def pool(self) -> ThreadPoolExecutor:
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="automation"
+            )
+
+        return self._pool
+
+    def close(self) -> None:
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+            self._pool = None
+
+    async def execute(
+            self,
+            node: "Automation",
+            router: "EndpointsRouter",
+            dependencies: list[asyncio.Task],
+            timing: NodeTiming,
+            origin: float,
+            incremental: bool = False
+    ) -> None:
+
+        if dependencies:
+            await asyncio.gather(*dependencies)
+
+        if incremental:
+            current = fingerprint(node, router)
+
+            if node.complete and (node.fingerprint == current):
+                timing.skipped = True
+
+                return
+
+            node.fingerprint = current
+
+        node.running = True
+        node.complete = False
+
+        start = time.perf_counter()
+
+        timing.start = start - origin
+
+        try:
+            if inspect.iscoroutinefunction(node.operation):
+                node.result = await node.operation(router)
+
+            else:
+                timing.offloaded = True
+
+                node.result = await asyncio.get_running_loop().run_in_executor(
+                    self.pool(), node.operation, router
+                )
+
+        finally:
+            timing.duration = time.perf_counter() - start
+
+            node.running = False
+
+        node.complete = True
+
+    async def run(
+            self,
+            root: "Automation",
+            router: "EndpointsRouter",
+            incremental: bool = False
+    ) -> Schedule:
+
+        schedule = Schedule()
+        tasks: dict[int, asyncio.Task] = {}
+
+        origin = time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+
+        for node in graph(root):
+            schedule.nodes += 1
+
+            if node.complete and not incremental:
+                schedule.skipped += 1
+
+                continue
+
+            timing = NodeTiming(name=name(node))
+
+            schedule.timings.append(timing)
+
+            tasks[id(node)] = loop.create_task(
+                self.execute(
+                    node,
+                    router,
+                    [
+                        tasks[id(automation)] for automation in node.automations
+                        if id(automation) in tasks
+                    ],
+                    timing,
+                    origin,
+                    incremental
+                )
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+
+        finally:
+            schedule.skipped += sum(timing.skipped for timing in schedule.timings)
+
+            for task in tasks.values():
+                task.cancel()
+
+            schedule.duration = time.perf_counter() - origin
+
+        return schedule
+
+    def automate(
+            self,
+            root: "Automation",
+            router: "EndpointsRouter",
+            incremental: bool = False
+    ) -> Schedule:
+
+        return asyncio.run(self.run(root, router, incremental=incremental))
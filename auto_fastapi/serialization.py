@@ -0,0 +1,252 @@
+# serialization.py
+
+import inspect
+import typing
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Any
+
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+__all__ = [
+    "Serializer",
+    "ORJSONResponse",
+    "json_response_class",
+    "build_serializer"
+]
+
+MEDIA_TYPE = "application/json"
+
+class ORJSONResponse(JSONResponse):
+
+    def render(self, content: ...) -> bytes:
+
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+        except TypeError:
+            return orjson.dumps(
+                jsonable_encoder(content), option=orjson.OPT_NON_STR_KEYS
+            )
+
+def json_response_class() -> type[JSONResponse]:
+
+    return JSONResponse if orjson is None else ORJSONResponse
+
+ANY = TypeAdapter(Any)
+
+def signature(c: Callable) -> inspect.Signature:
+
+    try:
+        return inspect.signature(c, eval_str=True)
+
+    except (NameError, TypeError):
+        return inspect.signature(c)
+
+def response_parameter(result: inspect.Signature) -> str | None:
+
+    for parameter in result.parameters.values():
+        if isinstance(parameter.annotation, type) and issubclass(
+            parameter.annotation, Response
+        ):
+            return parameter.name
+
+    return None
+
+def return_annotation(c: Callable) -> ...:
+
+    try:
+        return typing.get_type_hints(inspect.unwrap(c)).get("return")
+
+    except Exception:
+        return None
+
+@dataclass(slots=True, frozen=True)
+class Serializer:
+
+    validate: bool = True
+    use_orjson: bool = True
+
+    _adapters: dict[..., TypeAdapter] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def model(self, response_model: ..., c: Callable) -> ...:
+
+        if isinstance(response_model, DefaultPlaceholder):
+            response_model = return_annotation(c)
+
+        if (response_model is None) or (
+            isinstance(response_model, type) and issubclass(response_model, Response)
+        ):
+            return None
+
+        return response_model
+
+    def adapter(self, model: ...) -> TypeAdapter | None:
+
+        if model is None:
+            return None
+
+        try:
+            adapter = self._adapters.get(model)
+
+        except TypeError:
+            return TypeAdapter(model)
+
+        if adapter is None:
+            adapter = self._adapters[model] = TypeAdapter(model)
+
+        return adapter
+
+    def response_class(self) -> type[JSONResponse]:
+
+        return json_response_class() if self.use_orjson else JSONResponse
+
+    def compile(self, response_model: ..., c: Callable) -> TypeAdapter | None:
+
+        return self.adapter(self.model(response_model, c))
+
+    def encoder(
+            self,
+            adapter: TypeAdapter | None,
+            status_code: int | None,
+            options: dict[str, ...]
+    ) -> Callable[[..., Response | None], Response]:
+
+        status_code = status_code or 200
+
+        if adapter is not None:
+            validate = self.validate
+
+            def encode(result: ..., status: int) -> Response:
+
+                if validate:
+                    result = adapter.validate_python(result, from_attributes=True)
+
+                return Response(
+                    content=adapter.dump_json(result, **options),
+                    status_code=status,
+                    media_type=MEDIA_TYPE
+                )
+
+        elif (response_class := self.response_class()) is not JSONResponse:
+            def encode(result: ..., status: int) -> Response:
+
+                return response_class(result, status_code=status)
+
+        else:
+            def encode(result: ..., status: int) -> Response:
+
+                try:
+                    return Response(
+                        content=ANY.dump_json(result),
+                        status_code=status,
+                        media_type=MEDIA_TYPE
+                    )
+
+                except PydanticSerializationError:
+                    return JSONResponse(jsonable_encoder(result), status_code=status)
+
+        def respond(result: ..., sub_response: Response | None) -> Response:
+
+            if isinstance(result, Response):
+                return result
+
+            if sub_response is None:
+                response = encode(result, status_code)
+
+            else:
+                response = encode(result, sub_response.status_code or status_code)
+
+                response.headers.raw.extend(sub_response.headers.raw)
+
+            if not is_body_allowed_for_status_code(response.status_code):
+                response.body = b""
+
+            return response
+
+        return respond
+
+    def wrap(
+            self,
+            c: Callable,
+            response_model: ... = None,
+            status_code: int = None,
+            **options
+    ) -> Callable:
+
+        if inspect.isgeneratorfunction(c) or inspect.isasyncgenfunction(c):
+            return c
+
+        respond = self.encoder(
+            self.compile(response_model, c), status_code, options
+        )
+
+        result = signature(c)
+
+        name = response_parameter(result)
+        injected = name is None
+
+        if injected:
+            name = "response"
+
+            while name in result.parameters:
+                name = f"_{name}"
+
+            result = result.replace(
+                parameters=[
+                    *result.parameters.values(),
+                    inspect.Parameter(
+                        name, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+                    )
+                ]
+            )
+
+        def sub_response(kwargs: dict[str, ...]) -> Response | None:
+
+            return kwargs.pop(name, None) if injected else kwargs.get(name)
+
+        if (
+            inspect.iscoroutinefunction(c) or
+            inspect.iscoroutinefunction(getattr(c, "__call__", None))
+        ):
+            @wraps(c)
+            async def serialized(*args, **kwargs) -> Response:
+
+                response = sub_response(kwargs)
+
+                return respond(await c(*args, **kwargs), response)
+
+        else:
+            def execute(response: Response | None, /, *args, **kwargs) -> Response:
+
+                return respond(c(*args, **kwargs), response)
+
+            @wraps(c)
+            async def serialized(*args, **kwargs) -> Response:
+
+                return await run_in_threadpool(
+                    execute, sub_response(kwargs), *args, **kwargs
+                )
+
+        serialized.__signature__ = result
+
+        return serialized
+
+def build_serializer(validate: bool = True, use_orjson: bool = True) -> Serializer:
+
+    return Serializer(validate=validate, use_orjson=use_orjson)
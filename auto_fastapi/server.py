@@ -1,66 +1,660 @@
 # server.py
 
 import asyncio
+import signal
 import socket
 import time
+import threading
+import contextlib
+import multiprocessing
+from dataclasses import dataclass
+from multiprocessing.connection import wait, Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Callable, Iterable, Generator, Coroutine
 
 from uvicorn import Server as BaseServer, Config
 
 __all__ = [
     "Server",
-    "Config"
+    "Config",
+    "ExitSummary",
+    "ServerStats",
+    "MultiServer"
 ]
 
+STARTUP_FAILURE = 3
+EXIT_GRACE = 1.0
+
+SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+class NotifyingServer(BaseServer):
+
+    def __init__(self, config: Config, started: threading.Event) -> None:
+
+        super().__init__(config)
+
+        self.started_event = started
+
+    async def startup(self, sockets: list[socket.socket] = None) -> None:
+
+        try:
+            await super().startup(sockets=sockets)
+
+        finally:
+            self.started_event.set()
+
+class ManagedServer(NotifyingServer):
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Generator[None, None, None]:
+
+        yield
+
+    def install_signal_handlers(self) -> None:
+
+        pass
+
+def loop_factory(config: Config) -> Callable[[], asyncio.AbstractEventLoop] | None:
+
+    if hasattr(config, "get_loop_factory"):
+        return config.get_loop_factory()
+
+    config.setup_event_loop()
+
+def threadsafe(
+        c: Callable[..., Coroutine],
+        loop: asyncio.AbstractEventLoop,
+        *args,
+        **kwargs
+) -> ...:
+
+    try:
+        current = asyncio.get_running_loop()
+
+    except RuntimeError:
+        current = None
+
+    if current is loop:
+        raise RuntimeError(
+            f"Cannot block on {c} from its own event loop, await it instead."
+        )
+
+    return asyncio.run_coroutine_threadsafe(c(*args, **kwargs), loop).result()
+
+def bind_socket(config: Config, reuse_port: bool = False) -> socket.socket:
+
+    if not reuse_port:
+        return config.bind_socket()
+
+    family = socket.AF_INET
+
+    if config.host and (":" in config.host):
+        family = socket.AF_INET6
+
+    sock = socket.socket(family=family)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((config.host, config.port))
+    sock.set_inheritable(True)
+
+    return sock
+
+def work(
+        config: Config,
+        sockets: list[socket.socket] = None,
+        reuse_port: bool = False,
+        channel: Connection = None
+) -> None:
+
+    if sockets is None:
+        sockets = [bind_socket(config, reuse_port=reuse_port)]
+
+    server = Server(config)
+    requested = threading.Event()
+
+    def listen() -> None:
+
+        try:
+            timeout = channel.recv()
+
+        except (EOFError, OSError):
+            return
+
+        requested.set()
+
+        server._started.wait()
+
+        summary = server.exit(timeout=timeout)
+
+        try:
+            channel.send(summary)
+
+        except (OSError, ValueError):
+            pass
+
+    listener = threading.Thread(target=listen, daemon=True)
+    listener.start()
+
+    server.run(sockets=sockets)
+
+    if requested.is_set():
+        listener.join()
+
+def total(first: int | None, second: int | None) -> int | None:
+
+    if (first is None) and (second is None):
+        return None
+
+    return (first or 0) + (second or 0)
+
+@dataclass(slots=True)
+class ExitSummary:
+
+    drained: int | None = 0
+    aborted: int | None = 0
+    killed: int = 0
+    duration: float = 0.0
+
+    def __add__(self, other: "ExitSummary") -> "ExitSummary":
+
+        return ExitSummary(
+            drained=total(self.drained, other.drained),
+            aborted=total(self.aborted, other.aborted),
+            killed=self.killed + other.killed,
+            duration=max(self.duration, other.duration)
+        )
+
+@dataclass(slots=True)
+class ServerStats:
+
+    host: str
+    port: int
+    running: bool
+    ready: bool
+    requests: int = 0
+    connections: int = 0
+    in_flight: int = 0
+
 class Server:
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, capture_signals: bool = True) -> None:
+
+        self.capture_signals = capture_signals
 
         self._running = False
+        self._exiting = False
+        self._draining = False
 
         self.config = config
 
         self.server: BaseServer | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+        self.workers: list[BaseProcess] = []
+        self.restarts = 0
+
+        self._channels: list[Connection] = []
+        self._requested = False
+
+        self._wakeup: Connection | None = None
+        self._timeout: float | None = None
+        self._summary = ExitSummary()
+
+        self._started = threading.Event()
+        self._stopped = threading.Event()
+        self._stopped.set()
 
     @property
     def running(self) -> bool:
 
         return self._running
 
+    @property
+    def draining(self) -> bool:
+
+        return self._draining
+
+    @property
+    def ready(self) -> bool:
+
+        if self.workers:
+            return self.running and not self._exiting
+
+        return (
+            self.running and
+            not self.draining and
+            (self.server is not None) and
+            self.server.started
+        )
+
+    def stats(self) -> ServerStats:
+
+        stats = ServerStats(
+            host=self.config.host,
+            port=self.config.port,
+            running=self.running,
+            ready=self.ready
+        )
+
+        if self.server is not None:
+            state = self.server.server_state
+
+            stats.requests = state.total_requests
+            stats.connections = len(state.connections)
+            stats.in_flight = len(state.tasks)
+
+        return stats
+
     async def async_run(self, sockets: list[socket.socket] = None) -> None:
 
         if self.running:
             return
 
-        self.server = BaseServer(self.config)
+        self._started.clear()
 
-        self.config.setup_event_loop()
+        self.server = (
+            NotifyingServer if self.capture_signals else ManagedServer
+        )(self.config, self._started)
+        self.loop = asyncio.get_running_loop()
 
         self._running = True
+        self._stopped.clear()
 
-        await self.server.serve(sockets=sockets)
+        try:
+            await self.server.serve(sockets=sockets)
 
-        self._running = False
+        finally:
+            self._running = False
+            self._draining = False
+
+            self.loop = None
+
+            self._started.set()
+            self._stopped.set()
 
-    def run(self, sockets: list[socket.socket] = None) -> None:
+    def run(
+            self,
+            sockets: list[socket.socket] = None,
+            workers: int = None,
+            reuse_port: bool = False
+    ) -> None:
 
         if self.running:
             return
 
-        self.server = BaseServer(self.config)
+        if workers is not None:
+            self.supervise(workers, sockets=sockets, reuse_port=reuse_port)
+
+            return
+
+        asyncio.run(
+            self.async_run(sockets=sockets),
+            loop_factory=loop_factory(self.config)
+        )
+
+    @staticmethod
+    def context() -> BaseContext:
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+
+        return multiprocessing.get_context("spawn")
 
-        self.config.setup_event_loop()
+    def spawn(
+            self,
+            context: BaseContext,
+            sockets: list[socket.socket] = None,
+            reuse_port: bool = False
+    ) -> tuple[BaseProcess, Connection]:
 
+        channel, child = context.Pipe(duplex=True)
+
+        worker = context.Process(
+            target=work,
+            args=(self.config, sockets, reuse_port, child),
+            name=f"{type(self).__name__}-worker"
+        )
+        worker.start()
+
+        child.close()
+
+        return worker, channel
+
+    def stop(self, timeout: float = None) -> ExitSummary:
+
+        start = time.monotonic()
+
+        def remaining() -> float | None:
+
+            if timeout is None:
+                return None
+
+            return max(timeout + EXIT_GRACE - (time.monotonic() - start), 0)
+
+        for worker, channel in zip(self.workers, self._channels):
+            if worker.is_alive():
+                try:
+                    channel.send(timeout)
+
+                except (OSError, ValueError):
+                    worker.terminate()
+
+        summary = ExitSummary(drained=None, aborted=None)
+
+        for worker, channel in zip(self.workers, self._channels):
+            try:
+                if channel.poll(remaining()):
+                    summary += channel.recv()
+
+            except (EOFError, OSError):
+                pass
+
+            worker.join(remaining())
+
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
+
+                summary.killed += 1
+
+        summary.duration = time.monotonic() - start
+
+        return summary
+
+    def terminate(self) -> ExitSummary:
+
+        start = time.monotonic()
+
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
+
+        for worker in self.workers:
+            worker.join()
+
+        return ExitSummary(
+            drained=None, aborted=None, duration=time.monotonic() - start
+        )
+
+    def supervise(
+            self,
+            workers: int,
+            sockets: list[socket.socket] = None,
+            reuse_port: bool = False
+    ) -> None:
+
+        if self.running:
+            return
+
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer, got: {workers}")
+
+        context = self.context()
+
+        owned = []
+
+        if (sockets is None) and not reuse_port:
+            sockets = owned = [bind_socket(self.config)]
+
+        reader, self._wakeup = context.Pipe(duplex=False)
+
+        self._exiting = False
         self._running = True
+        self._stopped.clear()
+        self._started.set()
 
-        asyncio.run(self.server.serve(sockets=sockets))
+        self._requested = False
 
-        self._running = False
+        try:
+            for _ in range(workers):
+                worker, channel = self.spawn(context, sockets, reuse_port)
+
+                self.workers.append(worker)
+                self._channels.append(channel)
+
+            while not self._exiting:
+                wait([reader, *(worker.sentinel for worker in self.workers)])
+
+                for i, worker in enumerate(self.workers):
+                    if self._exiting or worker.is_alive():
+                        continue
+
+                    worker.join()
+
+                    if worker.exitcode == STARTUP_FAILURE:
+                        self._exiting = True
+
+                        break
+
+                    self._channels[i].close()
+
+                    self.workers[i], self._channels[i] = self.spawn(
+                        context, sockets, reuse_port
+                    )
+                    self.restarts += 1
+
+        finally:
+            self._exiting = True
+
+            if self._requested:
+                self._summary = self.stop(self._timeout)
+
+            else:
+                self._summary = self.terminate()
+
+            for sock in owned:
+                sock.close()
+
+            for channel in self._channels:
+                channel.close()
+
+            reader.close()
+            self._wakeup.close()
+
+            self._wakeup = None
+            self._timeout = None
+            self._requested = False
+            self.workers = []
+            self._channels = []
+
+            self._running = False
+            self._stopped.set()
+
+    async def drain(self, timeout: float = None) -> ExitSummary:
+
+        start = time.monotonic()
 
-    def exit(self) -> None:
+        server = self.server
 
-        self.server.should_exit = True
+        self._draining = True
 
-        while self.running:
-            time.sleep(0.0001)
+        for listener in getattr(server, "servers", ()):
+            listener.close()
+
+        tasks = set(server.server_state.tasks)
+
+        server.should_exit = True
+
+        pending = set()
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        if pending:
+            pending = set(server.server_state.tasks) | pending
+
+            for task in pending:
+                task.cancel()
+
+        return ExitSummary(
+            drained=len(tasks - pending),
+            aborted=len(pending),
+            duration=time.monotonic() - start
+        )
+
+    def exit(self, timeout: float = None) -> ExitSummary:
+
+        wakeup = self._wakeup
+
+        if wakeup is not None:
+            self._timeout = timeout
+            self._requested = True
+            self._exiting = True
+
+            try:
+                wakeup.send(None)
+
+            except (OSError, ValueError):
+                pass
+
+            self._stopped.wait()
+
+            return self._summary
+
+        summary = ExitSummary()
+
+        server, loop = self.server, self.loop
+
+        if (server is not None) and (loop is not None) and self.running:
+            summary = threadsafe(self.drain, loop, timeout=timeout)
+
+        elif server is not None:
+            server.should_exit = True
+
+        self._stopped.wait()
 
         self.server = None
+
+        return summary
+
+class MultiServer:
+
+    def __init__(self, configs: Iterable[Config]) -> None:
+
+        self.servers = [
+            Server(config, capture_signals=False) for config in configs
+        ]
+
+        self._running = False
+
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+        self._stopped = threading.Event()
+        self._stopped.set()
+
+    @property
+    def running(self) -> bool:
+
+        return self._running
+
+    @property
+    def ready(self) -> bool:
+
+        return self.running and all(server.ready for server in self.servers)
+
+    def stats(self) -> list[ServerStats]:
+
+        return [server.stats() for server in self.servers]
+
+    def handle_exit(self, sig: int, frame: ...) -> None:
+
+        for server in self.servers:
+            if server.server is None:
+                continue
+
+            if server.server.should_exit and (sig == signal.SIGINT):
+                server.server.force_exit = True
+
+            server.server.should_exit = True
+
+    @contextlib.contextmanager
+    def capture(self) -> Generator[None, None, None]:
+
+        if threading.current_thread() is not threading.main_thread():
+            yield
+
+            return
+
+        handlers = {sig: signal.signal(sig, self.handle_exit) for sig in SIGNALS}
+
+        try:
+            yield
+
+        finally:
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+
+    async def async_run(
+            self, sockets: Iterable[list[socket.socket] | None] = None
+    ) -> None:
+
+        if self.running:
+            return
+
+        if sockets is None:
+            sockets = [None] * len(self.servers)
+
+        self.loop = asyncio.get_running_loop()
+
+        self._running = True
+        self._stopped.clear()
+
+        try:
+            with self.capture():
+                tasks = [
+                    asyncio.ensure_future(server.async_run(sockets=s))
+                    for server, s in zip(self.servers, sockets)
+                ]
+
+                try:
+                    await asyncio.gather(*tasks)
+
+                except BaseException:
+                    self.handle_exit(signal.SIGTERM, None)
+
+                    await asyncio.wait(tasks)
+
+                    raise
+
+        finally:
+            self._running = False
+
+            self.loop = None
+
+            self._stopped.set()
+
+    def run(self, sockets: Iterable[list[socket.socket] | None] = None) -> None:
+
+        if self.running or not self.servers:
+            return
+
+        asyncio.run(
+            self.async_run(sockets=sockets),
+            loop_factory=loop_factory(self.servers[0].config)
+        )
+
+    async def drain(self, timeout: float = None) -> ExitSummary:
+
+        summaries = await asyncio.gather(
+            *(
+                server.drain(timeout=timeout)
+                for server in self.servers
+                if server.running and (server.server is not None)
+            )
+        )
+
+        return sum(summaries, ExitSummary())
+
+    def exit(self, timeout: float = None) -> ExitSummary:
+
+        summary = ExitSummary()
+
+        loop = self.loop
+
+        if (loop is not None) and self.running:
+            summary = threadsafe(self.drain, loop, timeout=timeout)
+
+        self._stopped.wait()
+
+        return summary
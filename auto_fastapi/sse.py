@@ -0,0 +1,432 @@
+# sse.py
+
+import asyncio
+import inspect
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from functools import update_wrapper
+from typing import Callable, Hashable, AsyncIterator
+
+from fastapi import Response
+from fastapi.sse import ServerSentEvent, format_sse_event, KEEPALIVE_COMMENT
+
+from auto_fastapi.flight import freeze
+from auto_fastapi.streaming import StreamResponse, dumps, signature
+
+__all__ = [
+    "EventSource",
+    "EventHub",
+    "EventStreamResponse",
+    "Subscriber",
+    "Topic",
+    "FanOutStats",
+    "POLICIES",
+    "build_event_source"
+]
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+POLICIES = (DROP_OLDEST, DISCONNECT)
+
+HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+ERROR_EVENT = format_sse_event(event="error", data_str="null")
+
+def encode(item: ...) -> bytes:
+
+    if isinstance(item, ServerSentEvent):
+        if item.raw_data is not None:
+            data = item.raw_data
+
+        elif item.data is not None:
+            data = dumps(item.data).decode()
+
+        else:
+            data = None
+
+        return format_sse_event(
+            data_str=data,
+            event=item.event,
+            id=item.id,
+            retry=item.retry,
+            comment=item.comment
+        )
+
+    return format_sse_event(data_str=dumps(item).decode())
+
+class EventStreamResponse(StreamResponse):
+
+    media_type = "text/event-stream"
+
+@dataclass(slots=True)
+class FanOutStats:
+
+    topics: int = 0
+    subscribers: int = 0
+    events: int = 0
+    dropped: int = 0
+    disconnected: int = 0
+    heartbeats: int = 0
+
+    def data(self) -> dict[str, int]:
+
+        return dict(
+            topics=self.topics,
+            subscribers=self.subscribers,
+            events=self.events,
+            dropped=self.dropped,
+            disconnected=self.disconnected,
+            heartbeats=self.heartbeats
+        )
+
+class Subscriber:
+
+    __slots__ = ("buffer", "size", "closed", "active", "_wake")
+
+    def __init__(self, size: int) -> None:
+
+        self.buffer: deque[bytes] = deque()
+        self.size = size
+        self.closed = False
+        self.active = False
+
+        self._wake = asyncio.Event()
+
+    def full(self) -> bool:
+
+        return len(self.buffer) >= self.size
+
+    def push(self, chunk: bytes) -> None:
+
+        self.buffer.append(chunk)
+        self._wake.set()
+
+    def close(self) -> None:
+
+        self.closed = True
+        self._wake.set()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+
+        while True:
+            if self.buffer:
+                chunks = b"".join(self.buffer)
+
+                self.buffer.clear()
+
+                yield chunks
+
+            elif self.closed:
+                return
+
+            else:
+                self._wake.clear()
+
+                await self._wake.wait()
+
+class Topic:
+
+    def __init__(
+            self,
+            hub: "EventHub",
+            key: Hashable,
+            source: Callable[[], AsyncIterator]
+    ) -> None:
+
+        self.hub = hub
+        self.key = key
+        self.source = source
+
+        self.subscribers: set[Subscriber] = set()
+
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+
+        self._task = asyncio.get_running_loop().create_task(self.produce())
+
+    def stop(self) -> None:
+
+        if self._task is not None:
+            self._task.cancel()
+
+    def publish(self, chunk: bytes) -> None:
+
+        hub = self.hub
+
+        for subscriber in tuple(self.subscribers):
+            if subscriber.full():
+                if hub.policy == DISCONNECT:
+                    hub.stats.disconnected += 1
+                    hub.stats.subscribers -= 1
+
+                    self.subscribers.discard(subscriber)
+
+                    subscriber.close()
+
+                    if not self.subscribers:
+                        hub.remove(self)
+
+                        self.stop()
+
+                        return
+
+                    continue
+
+                subscriber.buffer.popleft()
+
+                hub.stats.dropped += 1
+
+            subscriber.active = True
+            subscriber.push(chunk)
+
+    async def produce(self) -> None:
+
+        source = self.source()
+
+        try:
+            async for item in source:
+                self.hub.stats.events += 1
+
+                self.publish(encode(item))
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception:
+            logger.exception(
+                f"Event source failed, closing {len(self.subscribers)} subscribers"
+            )
+
+            for subscriber in self.subscribers:
+                subscriber.push(ERROR_EVENT)
+
+        finally:
+            close = getattr(source, "aclose", None)
+
+            if close is not None:
+                await close()
+
+            for subscriber in self.subscribers:
+                subscriber.close()
+
+            self.hub.remove(self)
+
+class EventHub:
+
+    def __init__(
+            self,
+            buffer: int = 256,
+            policy: str = DROP_OLDEST,
+            heartbeat: float = 15.0,
+            retry: int = None
+    ) -> None:
+
+        self.buffer = buffer
+        self.policy = policy
+        self.heartbeat = heartbeat
+        self.retry = retry
+
+        self.stats = FanOutStats()
+
+        self.topics: dict[Hashable, Topic] = {}
+
+        self._timers: dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+
+        return len(self.topics)
+
+    @staticmethod
+    def key(key: Hashable) -> Hashable:
+
+        return asyncio.get_running_loop(), key
+
+    def current(self) -> list[Topic]:
+
+        loop = asyncio.get_running_loop()
+
+        return [
+            topic for (owner, _), topic in tuple(self.topics.items())
+            if owner is loop
+        ]
+
+    def subscribe(
+            self,
+            key: Hashable,
+            source: Callable[[], AsyncIterator]
+    ) -> Subscriber:
+
+        key = self.key(key)
+        loop = key[0]
+
+        subscriber = Subscriber(self.buffer)
+
+        if self.retry is not None:
+            subscriber.push(format_sse_event(retry=self.retry))
+
+        topic = self.topics.get(key)
+
+        if topic is None:
+            topic = self.topics[key] = Topic(self, key, source)
+
+            self.stats.topics += 1
+
+            topic.start()
+
+        topic.subscribers.add(subscriber)
+
+        self.stats.subscribers += 1
+
+        if (loop not in self._timers) and self.heartbeat:
+            self._timers[loop] = loop.create_task(self.beat())
+
+        return subscriber
+
+    def unsubscribe(self, key: Hashable, subscriber: Subscriber) -> None:
+
+        topic = self.topics.get(self.key(key))
+
+        if (topic is None) or (subscriber not in topic.subscribers):
+            return
+
+        topic.subscribers.discard(subscriber)
+
+        self.stats.subscribers -= 1
+
+        if not topic.subscribers:
+            self.remove(topic)
+
+            topic.stop()
+
+    def remove(self, topic: Topic) -> None:
+
+        if self.topics.get(topic.key) is not topic:
+            return
+
+        del self.topics[topic.key]
+
+        self.stats.topics -= 1
+        self.stats.subscribers -= len(topic.subscribers)
+
+    async def beat(self) -> None:
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            while self.current():
+                await asyncio.sleep(self.heartbeat)
+
+                for topic in self.current():
+                    for subscriber in topic.subscribers:
+                        if subscriber.active:
+                            subscriber.active = False
+
+                        elif not subscriber.buffer:
+                            subscriber.push(KEEPALIVE_COMMENT)
+
+                            self.stats.heartbeats += 1
+
+        finally:
+            if self._timers.get(loop) is asyncio.current_task():
+                del self._timers[loop]
+
+    async def events(self, key: Hashable, subscriber: Subscriber) -> AsyncIterator[bytes]:
+
+        try:
+            async for chunk in subscriber.chunks():
+                yield chunk
+
+        finally:
+            self.unsubscribe(key, subscriber)
+
+def topic_key(c: Callable, args: tuple, kwargs: dict[str, ...]) -> Hashable:
+
+    try:
+        return c, freeze(args), freeze(kwargs)
+
+    except TypeError:
+        return object()
+
+@dataclass(slots=True, frozen=True, eq=False)
+class EventSource:
+
+    buffer: int = 256
+    policy: str = DROP_OLDEST
+    heartbeat: float = 15.0
+    retry: int = None
+
+    hub: EventHub = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+
+        if self.policy not in POLICIES:
+            raise ValueError(
+                f"policy must be one of {', '.join(POLICIES)}, "
+                f"not: {self.policy!r}"
+            )
+
+        if self.buffer < 1:
+            raise ValueError(f"buffer must be a positive integer, not: {self.buffer}")
+
+        object.__setattr__(
+            self,
+            "hub",
+            EventHub(
+                buffer=self.buffer,
+                policy=self.policy,
+                heartbeat=self.heartbeat,
+                retry=self.retry
+            )
+        )
+
+    def wrap(self, c: Callable, status_code: int = None) -> Callable:
+
+        if not (
+            inspect.isasyncgenfunction(c) or
+            inspect.isasyncgenfunction(getattr(c, "__call__", None))
+        ):
+            raise TypeError(
+                f"{type(self).__name__} can only bind async generator "
+                f"callables, got: {c}"
+            )
+
+        hub = self.hub
+
+        async def subscribe(*args, **kwargs) -> Response:
+
+            key = topic_key(c, args, kwargs)
+
+            subscriber = hub.subscribe(key, lambda: c(*args, **kwargs))
+
+            return EventStreamResponse(
+                hub.events(key, subscriber),
+                status_code=status_code or 200,
+                headers=HEADERS
+            )
+
+        update_wrapper(subscribe, c)
+
+        del subscribe.__wrapped__
+
+        subscribe.__signature__ = signature(c)
+
+        return subscribe
+
+def build_event_source(
+        buffer: int = 256,
+        policy: str = DROP_OLDEST,
+        heartbeat: float = 15.0,
+        retry: int = None
+) -> EventSource:
+
+    return EventSource(
+        buffer=buffer,
+        policy=policy,
+        heartbeat=heartbeat,
+        retry=retry
+    )
@@ -0,0 +1,388 @@
+# streaming.py
+
+import io
+import csv
+import inspect
+import threading
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from functools import update_wrapper
+from typing import Callable, Iterable, Iterator, AsyncIterator
+
+import anyio
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+from starlette.types import Scope, Receive, Send
+from pydantic_core import PydanticSerializationError
+
+from auto_fastapi.serialization import ANY, orjson
+
+__all__ = [
+    "Stream",
+    "StreamResponse",
+    "Framing",
+    "NDJSON",
+    "CSV",
+    "Bytes",
+    "FRAMINGS",
+    "build_streamer"
+]
+
+def dumps(value: ...) -> bytes:
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+        except TypeError:
+            pass
+
+    try:
+        return ANY.dump_json(value)
+
+    except PydanticSerializationError:
+        return ANY.dump_json(jsonable_encoder(value))
+
+class Framing(metaclass=ABCMeta):
+
+    media_type = "application/octet-stream"
+
+    @abstractmethod
+    def encode(self, items: list) -> bytes:
+
+        pass
+
+    def close(self) -> bytes:
+
+        return b""
+
+class NDJSON(Framing):
+
+    media_type = "application/x-ndjson"
+
+    def encode(self, items: list) -> bytes:
+
+        return b"".join([dumps(item) + b"\n" for item in items])
+
+class CSV(Framing):
+
+    media_type = "text/csv"
+
+    def __init__(self, columns: Iterable[str] = None, header: bool = True) -> None:
+
+        self.columns = None if columns is None else list(columns)
+        self.header = header
+
+        self._buffer = io.StringIO()
+        self._writer = None
+
+    @staticmethod
+    def row(item: ...) -> ...:
+
+        dump = getattr(item, "model_dump", None)
+
+        if dump is not None:
+            return dump()
+
+        return item
+
+    def writer(self, first: ...) -> ...:
+
+        if isinstance(first, dict):
+            columns = self.columns
+
+            if columns is None:
+                columns = list(first)
+
+            writer = csv.DictWriter(
+                self._buffer, fieldnames=columns, extrasaction="ignore"
+            )
+
+            if self.header:
+                writer.writeheader()
+
+            return writer
+
+        writer = csv.writer(self._buffer)
+
+        if self.header and (self.columns is not None):
+            writer.writerow(self.columns)
+
+        return writer
+
+    def encode(self, items: list) -> bytes:
+
+        rows = [self.row(item) for item in items]
+
+        if not rows:
+            return b""
+
+        if self._writer is None:
+            self._writer = self.writer(rows[0])
+
+        self._writer.writerows(rows)
+
+        data = self._buffer.getvalue()
+
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+        return data.encode()
+
+class Bytes(Framing):
+
+    media_type = "application/octet-stream"
+
+    @staticmethod
+    def chunk(item: ...) -> bytes:
+
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            return item
+
+        if isinstance(item, str):
+            return item.encode()
+
+        raise TypeError(
+            f"bytes streams can only yield bytes or str items, "
+            f"got: {type(item).__name__}"
+        )
+
+    def encode(self, items: list) -> bytes:
+
+        return b"".join([self.chunk(item) for item in items])
+
+FRAMINGS: dict[str, type[Framing]] = {
+    "ndjson": NDJSON,
+    "csv": CSV,
+    "bytes": Bytes
+}
+
+class StreamResponse(StreamingResponse):
+
+    async def stream_response(self, send: Send) -> None:
+
+        try:
+            await super().stream_response(send)
+
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+
+        if scope["type"] != "http":
+            await super().__call__(scope, receive, send)
+
+            return
+
+        async with anyio.create_task_group() as group:
+            async def watch() -> None:
+
+                await self.listen_for_disconnect(receive)
+
+                group.cancel_scope.cancel()
+
+            group.start_soon(watch)
+
+            try:
+                await self.stream_response(send)
+
+            except OSError:
+                raise ClientDisconnect()
+
+            group.cancel_scope.cancel()
+
+        if self.background is not None:
+            await self.background()
+
+class Producer:
+
+    def __init__(self, iterator: Iterator, framing: Framing) -> None:
+
+        self.iterator = iterator
+        self.framing = framing
+
+        self.closed = False
+
+        self._lock = threading.Lock()
+
+    def step(self, limit: int) -> tuple[bytes, bool]:
+
+        with self._lock:
+            if self.closed:
+                return b"", True
+
+            items = []
+
+            for item in self.iterator:
+                items.append(item)
+
+                if len(items) >= limit:
+                    return self.framing.encode(items), False
+
+            return self.framing.encode(items) + self.framing.close(), True
+
+    def close(self) -> None:
+
+        self.closed = True
+
+        with self._lock:
+            close = getattr(self.iterator, "close", None)
+
+            if close is not None:
+                close()
+
+@dataclass(slots=True, frozen=True)
+class Stream:
+
+    framing: str = "ndjson"
+    batch: int = 256
+    media_type: str = None
+    columns: tuple[str, ...] = None
+    header: bool = True
+
+    def __post_init__(self) -> None:
+
+        if self.framing not in FRAMINGS:
+            raise ValueError(
+                f"framing must be one of {', '.join(FRAMINGS)}, "
+                f"not: {self.framing!r}"
+            )
+
+        if self.batch < 1:
+            raise ValueError(f"batch must be a positive integer, not: {self.batch}")
+
+    def framer(self) -> Framing:
+
+        if self.framing == "csv":
+            return CSV(columns=self.columns, header=self.header)
+
+        return FRAMINGS[self.framing]()
+
+    async def chunks(self, source: AsyncIterator, framing: Framing) -> AsyncIterator[bytes]:
+
+        limit = 1
+        items = []
+
+        try:
+            async for item in source:
+                items.append(item)
+
+                if len(items) >= limit:
+                    yield framing.encode(items)
+
+                    items.clear()
+
+                    limit = self.batch
+
+            tail = framing.encode(items) + framing.close()
+
+            if tail:
+                yield tail
+
+        finally:
+            close = getattr(source, "aclose", None)
+
+            if close is not None:
+                with anyio.CancelScope(shield=True):
+                    await close()
+
+    async def steps(self, source: Iterator, framing: Framing) -> AsyncIterator[bytes]:
+
+        producer = Producer(source, framing)
+
+        limit = 1
+
+        try:
+            while True:
+                data, done = await run_in_threadpool(producer.step, limit)
+
+                if data:
+                    yield data
+
+                if done:
+                    break
+
+                limit = self.batch
+
+        finally:
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(producer.close)
+
+    def response(self, result: ..., status_code: int = None) -> Response:
+
+        if isinstance(result, Response):
+            return result
+
+        framing = self.framer()
+
+        if hasattr(result, "__aiter__"):
+            content = self.chunks(result.__aiter__(), framing)
+
+        else:
+            content = self.steps(iter(result), framing)
+
+        return StreamResponse(
+            content,
+            status_code=status_code or 200,
+            media_type=self.media_type or framing.media_type
+        )
+
+    def wrap(self, c: Callable, status_code: int = None) -> Callable:
+
+        if inspect.isgeneratorfunction(c) or inspect.isasyncgenfunction(c):
+            async def streamed(*args, **kwargs) -> Response:
+
+                return self.response(c(*args, **kwargs), status_code)
+
+        elif (
+            inspect.iscoroutinefunction(c) or
+            inspect.iscoroutinefunction(getattr(c, "__call__", None))
+        ):
+            async def streamed(*args, **kwargs) -> Response:
+
+                return self.response(await c(*args, **kwargs), status_code)
+
+        else:
+            async def streamed(*args, **kwargs) -> Response:
+
+                return self.response(
+                    await run_in_threadpool(c, *args, **kwargs), status_code
+                )
+
+        update_wrapper(streamed, c)
+
+        del streamed.__wrapped__
+
+        streamed.__signature__ = signature(c)
+
+        return streamed
+
+def signature(c: Callable) -> inspect.Signature:
+
+    try:
+        result = inspect.signature(c, eval_str=True)
+
+    except (NameError, TypeError):
+        result = inspect.signature(c)
+
+    return result.replace(return_annotation=Response)
+
+def build_streamer(
+        framing: str = "ndjson",
+        batch: int = 256,
+        media_type: str = None,
+        columns: Iterable[str] = None,
+        header: bool = True
+) -> Stream:
+
+    return Stream(
+        framing=framing,
+        batch=batch,
+        media_type=media_type,
+        columns=None if columns is None else tuple(columns),
+        header=header
+    )
@@ -0,0 +1,157 @@
+# __main__.py
+
+import sys
+import json
+import platform
+import argparse
+import datetime
+from importlib import metadata
+
+from benchmarks import (
+    registration,
+    automation,
+    throughput,
+    memory,
+    analysis,
+    serialization,
+    streaming,
+    sse,
+    broadcast,
+    routers,
+    mounting,
+    routing,
+    metrics
+)
+
+SUITES = (
+    "registration",
+    "automation",
+    "throughput",
+    "memory",
+    "analysis",
+    "serialization",
+    "streaming",
+    "sse",
+    "broadcast",
+    "routers",
+    "mounting",
+    "routing",
+    "metrics"
+)
+
+PACKAGES = ("auto-fastapi", "fastapi", "starlette", "pydantic", "uvicorn")
+
+def version(package: str) -> str | None:
+
+    try:
+        return metadata.version(package)
+
+    except metadata.PackageNotFoundError:
+        return None
+
+def environment() -> dict[str, ...]:
+
+    return dict(
+        time=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        packages={package: version(package) for package in PACKAGES}
+    )
+
+def flatten(data: dict[str, ...], prefix: str = "") -> dict[str, float]:
+
+    values = {}
+
+    for key, value in data.items():
+        key = f"{prefix}.{key}" if prefix else key
+
+        if isinstance(value, dict):
+            values.update(flatten(value, key))
+
+        elif isinstance(value, (int, float)):
+            values[key] = value
+
+    return values
+
+def compare(baseline: dict[str, ...], results: dict[str, ...]) -> None:
+
+    old = flatten(baseline["results"])
+    new = flatten(results["results"])
+
+    for key in sorted(old.keys() & new.keys()):
+        change = (new[key] / old[key] - 1) * 100 if old[key] else 0.0
+
+        print(f"{key:<50} {old[key]:14.6f} {new[key]:14.6f} {change:+8.1f}%")
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--output", help="path to write the JSON results to")
+    parser.add_argument("--compare", help="path of a previous JSON results file")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=SUITES)
+    parser.add_argument("--sizes", nargs="+", type=int, default=registration.SIZES)
+    parser.add_argument("--depths", nargs="+", type=int, default=automation.DEPTHS)
+    parser.add_argument("--requests", type=int, default=throughput.REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=throughput.CONCURRENCY)
+    parser.add_argument("--replicas", nargs="+", type=int, default=memory.REPLICAS)
+
+    args = parser.parse_args()
+
+    results = {}
+
+    if "registration" in args.suites:
+        results["registration"] = registration.run(tuple(args.sizes))
+
+    if "automation" in args.suites:
+        results["automation"] = automation.run(tuple(args.depths))
+
+    if "throughput" in args.suites:
+        results["throughput"] = throughput.run(args.requests, args.concurrency)
+
+    if "memory" in args.suites:
+        results["memory"] = memory.run(tuple(args.replicas))
+
+    if "analysis" in args.suites:
+        results["analysis"] = analysis.run()
+
+    if "serialization" in args.suites:
+        results["serialization"] = serialization.run()
+
+    if "streaming" in args.suites:
+        results["streaming"] = streaming.run()
+
+    if "sse" in args.suites:
+        results["sse"] = sse.run()
+
+    if "broadcast" in args.suites:
+        results["broadcast"] = broadcast.run()
+
+    if "routers" in args.suites:
+        results["routers"] = routers.run()
+
+    if "mounting" in args.suites:
+        results["mounting"] = mounting.run()
+
+    if "routing" in args.suites:
+        results["routing"] = routing.run()
+
+    if "metrics" in args.suites:
+        results["metrics"] = metrics.run()
+
+    data = dict(environment=environment(), results=results)
+
+    output = json.dumps(data, indent=4)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+
+    else:
+        sys.stdout.write(output + "\n")
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(json.load(file), data)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# analysis.py
+
+import time
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from auto_fastapi import Method, Builder, ANALYSIS, bind_all, add_all
+
+ENDPOINTS = 500
+APPS = 20
+
+class Item(BaseModel):
+
+    name: str
+    price: float
+    tags: list[str] = []
+
+class Result(BaseModel):
+
+    item: Item
+    total: float
+
+def create(item: Item, quantity: int = 1, discount: float = 0.0) -> Result:
+
+    return Result(item=item, total=item.price * quantity - discount)
+
+def read(item_id: int, verbose: bool = False) -> Result:
+
+    return Result(item=Item(name=str(item_id), price=0.0), total=0.0)
+
+def replicate(enabled: bool) -> tuple[float, dict[str, int]]:
+
+    ANALYSIS.enabled = enabled
+    ANALYSIS.clear()
+
+    stats = ANALYSIS.stats.data()
+
+    bound = bind_all(
+        (c, Builder.endpoint(f"/{c.__name__}/{i}/{{item_id}}", [method]))
+        for i in range(ENDPOINTS)
+        for c, method in ((create, Method.POST), (read, Method.GET))
+    )
+
+    start = time.perf_counter()
+
+    for _ in range(APPS):
+        add_all(FastAPI(), bound)
+
+    duration = time.perf_counter() - start
+
+    ANALYSIS.enabled = True
+
+    return duration, {
+        key: value - stats[key] for key, value in ANALYSIS.stats.data().items()
+    }
+
+def run() -> dict[str, dict[str, ...]]:
+
+    results = {}
+
+    for name, enabled in (("uncached", False), ("cached", True)):
+        duration, stats = replicate(enabled)
+
+        results[name] = dict(duration=duration, **stats)
+
+    return results
+
+def main() -> None:
+
+    for name, results in run().items():
+        print(
+            f"{name:<9} {ENDPOINTS * 2} endpoints x {APPS} apps: "
+            f"{results['duration']:8.3f}s "
+            f"hits: {results['hits']:>6} misses: {results['misses']:>6}"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# automation.py
+
+import time
+
+from fastapi import FastAPI
+
+from auto_fastapi import Automation, EndpointsRouter
+
+from benchmarks.utils import timed
+
+DEPTHS = (10, 100, 500)
+WIDTH = 4
+LATENCY = 0.002
+SCHEDULED_DEPTH = 25
+WORKERS = 16
+
+def operation(_: EndpointsRouter) -> None:
+
+    pass
+
+def blocking(_: EndpointsRouter) -> None:
+
+    time.sleep(LATENCY)
+
+def tree(depth: int, width: int = WIDTH, c=operation) -> Automation:
+
+    automation = Automation(c)
+
+    for _ in range(depth):
+        automation = Automation(
+            c,
+            automations=[
+                automation, *(Automation(c) for _ in range(width - 1))
+            ]
+        )
+
+    return automation
+
+def measure(depth: int, width: int = WIDTH) -> dict[str, float]:
+
+    automation, build_duration = timed(tree, depth, width)
+
+    _, automate_duration = timed(
+        automation.automate, EndpointsRouter(router=FastAPI())
+    )
+
+    nodes = 1 + depth * width
+
+    return dict(
+        nodes=nodes,
+        build=build_duration,
+        automate=automate_duration,
+        automate_per_node=automate_duration / nodes
+    )
+
+def scheduled(depth: int = SCHEDULED_DEPTH, width: int = WIDTH) -> dict[str, float]:
+
+    router = EndpointsRouter(router=FastAPI())
+
+    _, sequential = timed(tree(depth, width, blocking).automate, router)
+
+    schedule = tree(depth, width, blocking).schedule(router, workers=WORKERS)
+
+    return dict(
+        nodes=1 + depth * width,
+        latency=LATENCY,
+        sequential=sequential,
+        scheduled=schedule.duration
+    )
+
+def incremental(depth: int = SCHEDULED_DEPTH, width: int = WIDTH) -> dict[str, float]:
+
+    router = EndpointsRouter(router=FastAPI())
+
+    root = tree(depth, width, blocking)
+
+    full = root.rebuild(router, workers=WORKERS)
+
+    leaf = root.automations[-1]
+    leaf.inputs = "changed"
+
+    changed = root.rebuild(router, workers=WORKERS)
+
+    return dict(
+        nodes=full.nodes,
+        full=full.duration,
+        changed=changed.duration,
+        executed=changed.nodes - changed.skipped
+    )
+
+def run(depths: tuple[int, ...] = DEPTHS) -> dict[str, dict[str, float]]:
+
+    results = {str(depth): measure(depth) for depth in depths}
+    results["scheduled"] = scheduled()
+    results["incremental"] = incremental()
+
+    return results
+
+def main() -> None:
+
+    results = run()
+    scheduling = results.pop("scheduled")
+    rebuilding = results.pop("incremental")
+
+    for depth, results in results.items():
+        print(
+            f"depth {depth:>4} nodes: {results['nodes']:>5} "
+            f"automate: {results['automate']:8.4f}s"
+        )
+
+    print(
+        f"scheduled nodes: {scheduling['nodes']:>5} "
+        f"sequential: {scheduling['sequential']:8.4f}s "
+        f"scheduled: {scheduling['scheduled']:8.4f}s"
+    )
+    print(
+        f"rebuild   nodes: {rebuilding['nodes']:>5} "
+        f"full: {rebuilding['full']:8.4f}s "
+        f"one change: {rebuilding['changed']:8.4f}s "
+        f"executed: {rebuilding['executed']}"
+    )
+
+if __name__ == '__main__':
+    main()
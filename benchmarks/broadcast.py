@@ -0,0 +1,121 @@
+# broadcast.py
+
+import asyncio
+import time
+
+from fastapi import WebSocket
+from starlette.websockets import WebSocketState
+
+from auto_fastapi import Builder, BroadcastHub
+
+CONNECTIONS = 20_000
+MESSAGES = 20
+
+MESSAGE = {
+    "symbol": "A",
+    "bid": 100.25,
+    "ask": 100.27,
+    "levels": [[100.25, 10], [100.24, 25], [100.23, 40]]
+}
+
+class Sink:
+
+    def __init__(self) -> None:
+
+        self.count = 0
+        self.bytes = 0
+
+    async def send(self, message: dict[str, ...]) -> None:
+
+        self.count += 1
+        self.bytes += len(message.get("text") or message.get("bytes") or b"")
+
+    async def receive(self) -> dict[str, ...]:
+
+        await asyncio.Event().wait()
+
+def websocket(sink: Sink) -> WebSocket:
+
+    scope = {"type": "websocket", "path": "/", "headers": [], "query_string": b""}
+
+    ws = WebSocket(scope, sink.receive, sink.send)
+    ws.client_state = WebSocketState.CONNECTED
+    ws.application_state = WebSocketState.CONNECTED
+
+    return ws
+
+async def naive() -> dict[str, float]:
+
+    sink = Sink()
+    clients = [websocket(sink) for _ in range(CONNECTIONS)]
+
+    start = time.perf_counter()
+
+    for _ in range(MESSAGES):
+        for client in clients:
+            await client.send_json(MESSAGE)
+
+    return dict(duration=time.perf_counter() - start, sent=sink.count)
+
+async def hub() -> dict[str, float]:
+
+    sink = Sink()
+    broadcast: BroadcastHub = Builder.hub(queue=MESSAGES)
+
+    async def connection(ready: asyncio.Event, done: asyncio.Event) -> None:
+
+        async with broadcast.connect(websocket(sink), rooms=["quotes"]):
+            ready.set()
+
+            await done.wait()
+
+    done = asyncio.Event()
+    readies = [asyncio.Event() for _ in range(CONNECTIONS)]
+    tasks = [
+        asyncio.create_task(connection(ready, done)) for ready in readies
+    ]
+
+    for ready in readies:
+        await ready.wait()
+
+    start = time.perf_counter()
+
+    for _ in range(MESSAGES):
+        broadcast.publish("quotes", MESSAGE)
+
+    publish = time.perf_counter() - start
+
+    while sink.count < CONNECTIONS * MESSAGES:
+        await asyncio.sleep(0)
+
+    duration = time.perf_counter() - start
+
+    done.set()
+
+    await asyncio.gather(*tasks)
+
+    return dict(
+        duration=duration,
+        publish=publish,
+        sent=sink.count,
+        stats=broadcast.stats.data()
+    )
+
+def run() -> dict[str, dict[str, float]]:
+
+    return dict(
+        naive=asyncio.run(naive()),
+        hub=asyncio.run(hub())
+    )
+
+def main() -> None:
+
+    for name, result in run().items():
+        print(
+            f"{name:<6} duration: {result['duration']:6.2f}s "
+            f"sent: {result['sent']} " +
+            (f"publish: {result['publish'] * 1000:.1f}ms" if "publish" in result else "")
+        )
+
+if __name__ == '__main__':
+    main()
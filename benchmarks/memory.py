@@ -0,0 +1,105 @@
+# memory.py
+
+import gc
+import tracemalloc
+from dataclasses import replace
+from typing import Callable
+
+from auto_fastapi import Method, Builder, Endpoint, BoundEndpoint, bind, clone_all
+
+from benchmarks.utils import handler
+
+ENDPOINTS = 1_000
+METHODS = [Method.GET, Method.POST, Method.PUT, Method.PATCH, Method.DELETE]
+REPLICAS = (1, 10, 50)
+
+def spec(i: int) -> ...:
+
+    return Builder.endpoint(f"/endpoint/{i}", METHODS, tags=["benchmark"])
+
+def legacy(replicas: int) -> list[BoundEndpoint]:
+
+    bound = []
+
+    for _ in range(replicas):
+        for i in range(ENDPOINTS):
+            builder = replace(spec(i))
+
+            bound.append(
+                BoundEndpoint(
+                    c=handler,
+                    builder=builder,
+                    endpoints={
+                        method: Endpoint(
+                            c=handler,
+                            methods=builder.methods,
+                            **builder.data(),
+                            **builder.options()
+                        )
+                        for method in builder.methods
+                    }
+                )
+            )
+
+    return bound
+
+def flyweight(replicas: int) -> list[BoundEndpoint]:
+
+    bound = []
+
+    for _ in range(replicas):
+        bound.extend(bind(handler, spec(i)) for i in range(ENDPOINTS))
+
+    return bound
+
+def cloned(replicas: int) -> list[BoundEndpoint]:
+
+    bound = [bind(handler, spec(i)) for i in range(ENDPOINTS)]
+
+    replicated = list(bound)
+
+    for _ in range(replicas - 1):
+        replicated.extend(clone_all(bound))
+
+    return replicated
+
+def measure(c: Callable[[int], list], replicas: int) -> int:
+
+    gc.collect()
+
+    tracemalloc.start()
+
+    data = c(replicas)
+
+    size = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    del data
+
+    return size
+
+def run(replicas: tuple[int, ...] = REPLICAS) -> dict[str, dict[str, int]]:
+
+    return {
+        str(count): dict(
+            legacy=measure(legacy, count),
+            flyweight=measure(flyweight, count),
+            cloned=measure(cloned, count)
+        )
+        for count in replicas
+    }
+
+def main() -> None:
+
+    for count, results in run().items():
+        print(
+            f"replicas: {count:>3} " +
+            " ".join(
+                f"{name}: {size / 1024 / 1024:8.2f}MiB"
+                for name, size in results.items()
+            )
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# metrics.py
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from auto_fastapi import Method, Builder, AutoFastAPI, bind, Metrics
+
+from benchmarks.routing import request
+
+ENDPOINTS = 100
+REQUESTS = 5000
+ROUNDS = 5
+
+def handler() -> dict[str, str]:
+
+    return {"response": "success"}
+
+def build(metrics: Metrics = None) -> FastAPI:
+
+    app = FastAPI()
+
+    auto = AutoFastAPI(app, metrics=metrics)
+
+    for i in range(ENDPOINTS):
+        auto.add(app, bind(handler, Builder.endpoint(f"/endpoint/{i}", [Method.GET])))
+
+    return app
+
+async def serve(app: FastAPI) -> float:
+
+    paths = [f"/endpoint/{i % ENDPOINTS}" for i in range(REQUESTS)]
+
+    await request(app, "GET", paths[0])
+
+    start = time.perf_counter()
+
+    for path in paths:
+        await request(app, "GET", path)
+
+    return (time.perf_counter() - start) / len(paths)
+
+def run() -> dict[str, float]:
+
+    apps = {"plain": build(), "metrics": build(Metrics())}
+    results = dict.fromkeys(apps, float("inf"))
+
+    for _ in range(ROUNDS):
+        for name, app in apps.items():
+            results[name] = min(results[name], asyncio.run(serve(app)))
+
+    results["overhead"] = results["metrics"] - results["plain"]
+
+    return results
+
+def main() -> None:
+
+    results = run()
+
+    for name in ("plain", "metrics"):
+        print(f"{name:<8} request: {results[name] * 1_000_000:8.1f}us")
+
+    print(
+        f"overhead: {results['overhead'] * 1_000_000:8.1f}us "
+        f"({(results['metrics'] / results['plain'] - 1) * 100:.1f}%)"
+    )
+
+if __name__ == '__main__':
+    main()
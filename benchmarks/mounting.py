@@ -0,0 +1,108 @@
+# mounting.py
+
+import asyncio
+import time
+import tracemalloc
+from functools import partial
+
+from fastapi import FastAPI, APIRouter
+from pydantic import create_model
+
+from auto_fastapi import EndpointsRouter
+
+from benchmarks.routing import request
+
+GROUPS = 50
+ROUTES = 20
+
+def group(index: int) -> APIRouter:
+
+    router = APIRouter()
+
+    for i in range(ROUTES):
+        model = create_model(
+            f"Group{index}Model{i}",
+            id=(int, ...),
+            name=(str, ...),
+            price=(float, 0.0),
+            tags=(list[str], [])
+        )
+
+        def handler(id: int, model=model) -> ...:
+
+            return model(id=id, name="item")
+
+        router.add_api_route(
+            f"/items{i}/{{id}}", handler, methods=["GET"], response_model=model
+        )
+
+    return router
+
+def startup(lazy: bool) -> tuple[FastAPI, float, int]:
+
+    tracemalloc.start()
+
+    start = time.perf_counter()
+
+    app = FastAPI()
+    root = EndpointsRouter(app)
+
+    if lazy:
+        for index in range(GROUPS):
+            root.defer(f"/group{index}", partial(group, index))
+
+    else:
+        root.include_all(
+            (EndpointsRouter(group(index)), dict(prefix=f"/group{index}"))
+            for index in range(GROUPS)
+        )
+
+    duration = time.perf_counter() - start
+
+    memory = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    return app, duration, memory
+
+async def first_request(app: FastAPI) -> float:
+
+    start = time.perf_counter()
+
+    status = await request(app, "GET", "/group0/items0/1")
+
+    duration = time.perf_counter() - start
+
+    if status != 200:
+        raise AssertionError(f"/group0/items0/1 answered {status}, not 200")
+
+    return duration
+
+def run() -> dict[str, dict[str, float]]:
+
+    results = {}
+
+    for name, lazy in (("eager", False), ("lazy", True)):
+        app, duration, memory = startup(lazy)
+
+        results[name] = dict(
+            groups=GROUPS,
+            routes=GROUPS * ROUTES,
+            startup=duration,
+            memory=memory,
+            first_request=asyncio.run(first_request(app))
+        )
+
+    return results
+
+def main() -> None:
+
+    for name, result in run().items():
+        print(
+            f"{name:<6} startup: {result['startup'] * 1000:8.1f}ms "
+            f"memory: {result['memory'] / 2 ** 20:7.2f}MiB "
+            f"first request: {result['first_request'] * 1000:7.1f}ms"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+# registration.py
+
+from fastapi import FastAPI
+
+from auto_fastapi import AutoFastAPI, bind_all, add_all, push_all, clone_all
+
+from benchmarks.utils import endpoints, timed
+
+SIZES = (100, 1_000, 10_000)
+
+def measure(size: int) -> dict[str, float]:
+
+    data = endpoints(size)
+
+    bound, bind_duration = timed(bind_all, data)
+    _, clone_duration = timed(clone_all, bound)
+    _, add_duration = timed(add_all, FastAPI(), bound)
+    _, push_duration = timed(push_all, FastAPI(), data)
+
+    auto = AutoFastAPI(bound=clone_all(bound))
+
+    _, auto_duration = timed(auto.add_all, FastAPI())
+
+    return dict(
+        bind=bind_duration,
+        clone_all=clone_duration,
+        add=add_duration,
+        push_all=push_duration,
+        add_all=auto_duration,
+        add_all_per_endpoint=auto_duration / size
+    )
+
+def run(sizes: tuple[int, ...] = SIZES) -> dict[str, dict[str, float]]:
+
+    return {str(size): measure(size) for size in sizes}
+
+def main() -> None:
+
+    for size, results in run().items():
+        print(
+            f"{size:>6} " +
+            " ".join(f"{name}: {value:8.4f}s" for name, value in results.items())
+        )
+
+if __name__ == '__main__':
+    main()
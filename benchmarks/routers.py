@@ -0,0 +1,124 @@
+# routers.py
+
+import time
+
+from fastapi import FastAPI, APIRouter
+
+from auto_fastapi import BaseEndpoints, EndpointsRouter
+
+from benchmarks.utils import timed
+
+DEPTH = 4
+BRANCHING = 5
+ROUTES = 3
+SELECTS = 10_000
+
+KINDS = [type(f"Endpoints{i}", (BaseEndpoints,), {}) for i in range(50)]
+
+def handler() -> dict[str, int]:
+
+    return {"value": 0}
+
+def tree(depth: int = DEPTH, branching: int = BRANCHING, index: int = 0) -> EndpointsRouter:
+
+    router = APIRouter(prefix=f"/r{index}", tags=[f"r{index}"])
+
+    for i in range(ROUTES):
+        router.add_api_route(f"/route{i}", handler, methods=["GET"])
+
+    return EndpointsRouter(
+        router=router,
+        endpoints=KINDS[index % len(KINDS)](),
+        routers=[
+            tree(depth - 1, branching, i) for i in range(branching)
+        ] if depth else []
+    )
+
+def nested(root: EndpointsRouter) -> None:
+
+    for router in root.routers:
+        nested(router)
+
+        root.router.include_router(router.router)
+
+def count(root: EndpointsRouter) -> int:
+
+    return 1 + sum(count(router) for router in root.routers)
+
+def include() -> dict[str, float]:
+
+    app = FastAPI()
+    root = EndpointsRouter(app, routers=[tree()])
+
+    start = time.perf_counter()
+    nested(root)
+    app.openapi()
+    nested_duration = time.perf_counter() - start
+
+    app = FastAPI()
+    root = EndpointsRouter(app, routers=[tree()])
+
+    start = time.perf_counter()
+    root.include()
+    app.openapi()
+    recursive_duration = time.perf_counter() - start
+
+    return dict(
+        routers=count(root) - 1,
+        nested=nested_duration,
+        recursive=recursive_duration
+    )
+
+def select() -> dict[str, float]:
+
+    root = EndpointsRouter(
+        FastAPI(),
+        routers=[
+            EndpointsRouter(APIRouter(), endpoints=kind()) for kind in KINDS
+        ]
+    )
+
+    last = KINDS[-1]
+
+    def scan() -> None:
+
+        for _ in range(SELECTS):
+            for router in root.routers:
+                if isinstance(router.endpoints, last):
+                    break
+
+    def indexed() -> None:
+
+        for _ in range(SELECTS):
+            root.select(last)
+
+    _, scan_duration = timed(scan)
+    _, indexed_duration = timed(indexed)
+
+    return dict(
+        routers=len(KINDS),
+        scan=scan_duration / SELECTS,
+        indexed=indexed_duration / SELECTS
+    )
+
+def run() -> dict[str, dict[str, float]]:
+
+    return dict(include=include(), select=select())
+
+def main() -> None:
+
+    results = run()
+
+    print(
+        f"include routers: {results['include']['routers']} "
+        f"nested: {results['include']['nested']:.3f}s "
+        f"recursive: {results['include']['recursive']:.3f}s"
+    )
+    print(
+        f"select  routers: {results['select']['routers']} "
+        f"scan: {results['select']['scan'] * 1e6:.2f}us "
+        f"indexed: {results['select']['indexed'] * 1e6:.2f}us"
+    )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# routing.py
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from auto_fastapi import (
+    Method, Builder, bind, add_endpoint, BoundEndpoint, dispatch
+)
+
+ENDPOINTS = 2000
+METHODS = [Method.GET, Method.POST, Method.PUT, Method.PATCH, Method.DELETE]
+REQUESTS = 2000
+
+def handler() -> dict[str, str]:
+
+    return {"response": "success"}
+
+def add_per_method(app: FastAPI, endpoint: BoundEndpoint) -> None:
+
+    for method in endpoint.endpoints:
+        getattr(app, method.value.lower())(**endpoint.data())(endpoint.c)
+
+def build(add) -> tuple[FastAPI, float]:
+
+    app = FastAPI()
+
+    start = time.perf_counter()
+
+    for i in range(ENDPOINTS):
+        add(app, bind(handler, Builder.endpoint(f"/endpoint/{i}", METHODS)))
+
+    return app, time.perf_counter() - start
+
+async def request(app: FastAPI, method: str, path: str) -> int:
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80)
+    }
+
+    async def receive() -> dict[str, ...]:
+
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status = []
+
+    async def send(message: dict[str, ...]) -> None:
+
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+
+    return status[0]
+
+async def serve(app: FastAPI) -> float:
+
+    paths = [
+        f"/endpoint/{i}"
+        for i in range(0, ENDPOINTS, max(ENDPOINTS // REQUESTS, 1))
+    ]
+
+    await request(app, "DELETE", paths[0])
+
+    start = time.perf_counter()
+
+    for path in paths:
+        await request(app, "DELETE", path)
+
+    return (time.perf_counter() - start) / len(paths)
+
+def operations(app: FastAPI) -> dict[tuple[str, str], str]:
+
+    return {
+        (path, method): operation["operationId"]
+        for path, item in app.openapi()["paths"].items()
+        for method, operation in item.items()
+    }
+
+def run() -> dict[str, dict[str, float]]:
+
+    results = {}
+    schemas = {}
+
+    for name, add, dispatched in (
+        ("per-method", add_per_method, False),
+        ("single-route", add_endpoint, False),
+        ("dispatcher", add_endpoint, True)
+    ):
+        app, duration = build(add)
+
+        if dispatched:
+            dispatch(app)
+
+        latency = asyncio.run(serve(app))
+
+        schemas[name] = operations(app)
+
+        results[name] = dict(routes=len(app.routes), build=duration, request=latency)
+
+    for name, schema in schemas.items():
+        if schema != schemas["per-method"]:
+            raise AssertionError(f"OpenAPI operations of {name} differ from per-method")
+
+    return results
+
+def main() -> None:
+
+    for name, result in run().items():
+        print(
+            f"{name:<14} routes: {result['routes']:>6} "
+            f"build: {result['build']:8.3f}s "
+            f"request: {result['request'] * 1_000_000:8.1f}us"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# serialization.py
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from auto_fastapi import Method, Builder, AutoFastAPI, Serializer
+
+from benchmarks.routing import request
+
+ITEMS = 5_000
+REQUESTS = 50
+ROUNDS = 3
+
+class Item(BaseModel):
+
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+
+ITEMS_DATA = [
+    Item(id=i, name=f"item-{i}", price=i * 1.5, tags=["a", "b"])
+    for i in range(ITEMS)
+]
+DICTS_DATA = [item.model_dump() for item in ITEMS_DATA]
+
+async def models() -> list[Item]:
+
+    return ITEMS_DATA
+
+async def dicts():
+
+    return DICTS_DATA
+
+def application(serializer: Serializer = None) -> FastAPI:
+
+    app = FastAPI()
+
+    AutoFastAPI(app).push_all(
+        [
+            (models, Builder.endpoint("/models", [Method.GET], serializer=serializer)),
+            (dicts, Builder.endpoint("/dicts", [Method.GET], serializer=serializer))
+        ]
+    )
+
+    return app
+
+async def serve(app: FastAPI, path: str) -> float:
+
+    await request(app, "GET", path)
+
+    start = time.perf_counter()
+
+    for _ in range(REQUESTS):
+        await request(app, "GET", path)
+
+    return (time.perf_counter() - start) / REQUESTS
+
+def run() -> dict[str, dict[str, float]]:
+
+    apps = {
+        "default": application(),
+        "serializer": application(Builder.serializer()),
+        "trusted": application(Builder.serializer(validate=False))
+    }
+
+    results = {name: {} for name in apps}
+
+    for _ in range(ROUNDS):
+        for name, app in apps.items():
+            for path in ("/models", "/dicts"):
+                latency = asyncio.run(serve(app, path))
+
+                results[name][path[1:]] = min(
+                    results[name].get(path[1:], float("inf")), latency
+                )
+
+    return results
+
+def main() -> None:
+
+    for name, results in run().items():
+        print(
+            f"{name:<11} " +
+            " ".join(
+                f"{path}: {latency * 1000:8.2f}ms"
+                for path, latency in results.items()
+            )
+        )
+
+if __name__ == '__main__':
+    main()
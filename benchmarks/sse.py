@@ -0,0 +1,126 @@
+# sse.py
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.sse import EventSourceResponse
+
+from auto_fastapi import Method, Builder, AutoFastAPI
+
+SUBSCRIBERS = 1000
+EVENTS = 100
+INTERVAL = 0.005
+
+producers = 0
+
+async def quotes(symbol: str = "A"):
+
+    global producers
+
+    producers += 1
+
+    for i in range(EVENTS):
+        yield {"symbol": symbol, "price": 100 + i * 0.01, "sequence": i}
+
+        await asyncio.sleep(INTERVAL)
+
+def application() -> FastAPI:
+
+    app = FastAPI()
+
+    AutoFastAPI(app).push_all(
+        [
+            (
+                quotes,
+                Builder.endpoint(
+                    "/native", [Method.GET], response_class=EventSourceResponse
+                )
+            ),
+            (quotes, Builder.sse("/shared", buffer=EVENTS * 2))
+        ]
+    )
+
+    return app
+
+async def subscribe(app: FastAPI, path: str) -> int:
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"symbol=A",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80)
+    }
+
+    done = asyncio.Event()
+    size = 0
+
+    async def receive() -> dict[str, ...]:
+
+        await done.wait()
+
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, ...]) -> None:
+
+        nonlocal size
+
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+            if not message.get("more_body", False):
+                done.set()
+
+    await app(scope, receive, send)
+
+    return size
+
+async def fan_out(app: FastAPI, path: str) -> dict[str, float]:
+
+    global producers
+
+    producers = 0
+
+    start = time.perf_counter()
+    cpu = time.process_time()
+
+    sizes = await asyncio.gather(
+        *(subscribe(app, path) for _ in range(SUBSCRIBERS))
+    )
+
+    return dict(
+        duration=time.perf_counter() - start,
+        cpu=time.process_time() - cpu,
+        producers=producers,
+        bytes=sum(sizes)
+    )
+
+def run() -> dict[str, dict[str, float]]:
+
+    app = application()
+
+    return {
+        path[1:]: asyncio.run(fan_out(app, path))
+        for path in ("/native", "/shared")
+    }
+
+def main() -> None:
+
+    for name, result in run().items():
+        print(
+            f"{name:<7} duration: {result['duration']:6.2f}s "
+            f"cpu: {result['cpu']:6.2f}s "
+            f"producers: {result['producers']:5} "
+            f"bytes: {result['bytes']}"
+        )
+
+if __name__ == '__main__':
+    main()
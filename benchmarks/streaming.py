@@ -0,0 +1,130 @@
+# streaming.py
+
+import asyncio
+import time
+import tracemalloc
+
+from fastapi import FastAPI
+
+from auto_fastapi import Method, Builder, AutoFastAPI
+
+ROWS = 200_000
+
+def row(i: int) -> dict:
+
+    return {"id": i, "name": f"row-{i}", "price": i * 1.5, "active": bool(i % 2)}
+
+def listing() -> list[dict]:
+
+    return [row(i) for i in range(ROWS)]
+
+def rows():
+
+    for i in range(ROWS):
+        yield row(i)
+
+def application() -> FastAPI:
+
+    app = FastAPI()
+
+    AutoFastAPI(app).push_all(
+        [
+            (listing, Builder.endpoint("/list", [Method.GET])),
+            (rows, Builder.endpoint("/generator", [Method.GET])),
+            (rows, Builder.stream("/ndjson")),
+            (rows, Builder.stream("/csv", framing="csv"))
+        ]
+    )
+
+    return app
+
+async def consume(app: FastAPI, path: str) -> dict[str, float]:
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80)
+    }
+
+    done = asyncio.Event()
+    first = None
+    size = 0
+
+    async def receive() -> dict[str, ...]:
+
+        await done.wait()
+
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, ...]) -> None:
+
+        nonlocal first, size
+
+        if message["type"] == "http.response.body":
+            if (first is None) and message.get("body"):
+                first = time.perf_counter()
+
+            size += len(message.get("body", b""))
+
+            if not message.get("more_body", False):
+                done.set()
+
+    start = time.perf_counter()
+
+    await app(scope, receive, send)
+
+    end = time.perf_counter()
+
+    return dict(
+        first_byte=first - start,
+        total=end - start,
+        size=size
+    )
+
+def peak(app: FastAPI, path: str) -> int:
+
+    tracemalloc.start()
+
+    try:
+        asyncio.run(consume(app, path))
+
+        return tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+def run() -> dict[str, dict[str, float]]:
+
+    app = application()
+
+    results = {}
+
+    for path in ("/list", "/generator", "/ndjson", "/csv"):
+        result = asyncio.run(consume(app, path))
+        result["peak"] = peak(app, path)
+
+        results[path[1:]] = result
+
+    return results
+
+def main() -> None:
+
+    for name, result in run().items():
+        print(
+            f"{name:<10} first byte: {result['first_byte'] * 1000:9.2f}ms "
+            f"total: {result['total'] * 1000:9.2f}ms "
+            f"peak: {result['peak'] / 2 ** 20:8.2f}MiB "
+            f"size: {result['size'] / 2 ** 20:6.2f}MiB"
+        )
+
+if __name__ == '__main__':
+    main()
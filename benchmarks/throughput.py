@@ -0,0 +1,109 @@
+# throughput.py
+
+import asyncio
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from auto_fastapi import AutoFastAPI, Server, Config
+
+from benchmarks.utils import endpoints, latencies, free_port
+
+ENDPOINTS = 10
+REQUESTS = 5_000
+CONCURRENCY = 32
+
+def application() -> FastAPI:
+
+    app = FastAPI()
+
+    AutoFastAPI().push_all(app, endpoints(ENDPOINTS))
+
+    return app
+
+async def load(
+        client: httpx.AsyncClient,
+        requests: int,
+        concurrency: int
+) -> dict[str, float]:
+
+    paths = [f"/endpoint/{i % ENDPOINTS}?value={i}" for i in range(requests)]
+    values = []
+
+    await client.get(paths[0])
+
+    async def worker(offset: int) -> None:
+
+        for path in paths[offset::concurrency]:
+            start = time.perf_counter()
+
+            response = await client.get(path)
+
+            values.append(time.perf_counter() - start)
+
+            response.raise_for_status()
+
+    start = time.perf_counter()
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+    return latencies(values, time.perf_counter() - start)
+
+async def asgi(requests: int, concurrency: int) -> dict[str, float]:
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=application()),
+        base_url="http://benchmark"
+    ) as client:
+        return await load(client, requests, concurrency)
+
+async def server(requests: int, concurrency: int) -> dict[str, float]:
+
+    port = free_port()
+
+    instance = Server(
+        Config(application(), host="127.0.0.1", port=port, log_level="warning"),
+        capture_signals=False
+    )
+
+    thread = threading.Thread(target=instance.run)
+    thread.start()
+
+    try:
+        while not instance.ready:
+            await asyncio.sleep(0.01)
+
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            limits=httpx.Limits(max_connections=concurrency)
+        ) as client:
+            return await load(client, requests, concurrency)
+
+    finally:
+        await asyncio.to_thread(instance.exit)
+
+        thread.join()
+
+def run(
+        requests: int = REQUESTS,
+        concurrency: int = CONCURRENCY
+) -> dict[str, dict[str, float]]:
+
+    return dict(
+        asgi=asyncio.run(asgi(requests, concurrency)),
+        server=asyncio.run(server(requests, concurrency))
+    )
+
+def main() -> None:
+
+    for name, results in run().items():
+        print(
+            f"{name:<6} rps: {results['rps']:8.1f} "
+            f"p50: {results['p50'] * 1000:7.2f}ms "
+            f"p99: {results['p99'] * 1000:7.2f}ms"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# utils.py
+
+import time
+import socket
+from typing import Callable, Iterable
+
+from auto_fastapi import Method, Builder, EndpointBuilder
+
+__all__ = [
+    "handler",
+    "endpoints",
+    "timed",
+    "percentile",
+    "latencies",
+    "free_port"
+]
+
+METHODS = [Method.GET, Method.POST]
+
+def handler(value: int = 0) -> dict[str, int]:
+
+    return {"value": value}
+
+def endpoints(
+        count: int,
+        prefix: str = "/endpoint"
+) -> list[tuple[Callable, EndpointBuilder]]:
+
+    return [
+        (handler, Builder.endpoint(f"{prefix}/{i}", METHODS))
+        for i in range(count)
+    ]
+
+def timed(c: Callable, *args, **kwargs) -> tuple[..., float]:
+
+    start = time.perf_counter()
+
+    result = c(*args, **kwargs)
+
+    return result, time.perf_counter() - start
+
+def percentile(values: list[float], fraction: float) -> float:
+
+    if not values:
+        return 0.0
+
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+def latencies(values: Iterable[float], duration: float) -> dict[str, float]:
+
+    values = sorted(values)
+
+    return dict(
+        requests=len(values),
+        duration=duration,
+        rps=len(values) / duration if duration else 0.0,
+        p50=percentile(values, 0.50),
+        p99=percentile(values, 0.99),
+        max=values[-1] if values else 0.0
+    )
+
+def free_port(host: str = "127.0.0.1") -> int:
+
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+
+        return sock.getsockname()[1]